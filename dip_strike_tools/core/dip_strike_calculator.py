@@ -22,7 +22,16 @@
 Calculator for dip and strike values.
 """
 
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from qgis.core import (
+    Qgis,
+    QgsFeatureRequest,
     QgsField,
     QgsVectorLayer,
     edit,
@@ -63,6 +72,37 @@ class DipStrikeCalculator:
         """
         return dip_strike_math.calculate_strike_from_dip(dip_azimuth, decimal_places)
 
+    def _calculate_values(self, input_values, calculation_type, decimal_places=2):
+        """Calculate dip or strike azimuths for a batch of input values.
+
+        Values are computed in a single vectorized operation when NumPy is available (it ships with QGIS),
+        otherwise the scalar calculation methods are applied to each value.
+
+        :param input_values: Input azimuths in degrees
+        :type input_values: list
+        :param calculation_type: 'dip_from_strike' or 'strike_from_dip'
+        :type calculation_type: str
+        :param decimal_places: Number of decimal places to round to
+        :type decimal_places: int
+        :return: Output azimuths in degrees, None for invalid or non-finite input values
+        :rtype: list[float | None]
+        """
+        if np is None:
+            if calculation_type == "dip_from_strike":
+                calculate = self.calculate_dip_from_strike
+            else:  # strike_from_dip
+                calculate = self.calculate_strike_from_dip
+            output_values = (calculate(value, decimal_places) for value in input_values)
+            # The scalar methods return NaN for infinite or NaN input, report it as invalid like the NumPy path
+            return [value if value is not None and math.isfinite(value) else None for value in output_values]
+
+        azimuths = np.fromiter((_to_float(value) for value in input_values), dtype=float, count=len(input_values))
+        offset = 90.0 if calculation_type == "dip_from_strike" else -90.0
+        with np.errstate(invalid="ignore"):
+            output_values = np.mod(azimuths + offset, 360.0)
+        # Round with the built-in round(), as the scalar methods do: np.round can differ on halfway values
+        return [round(value, decimal_places) if math.isfinite(value) else None for value in output_values.tolist()]
+
     def process_layer(self, config):
         """Process a layer to calculate dip or strike values.
 
@@ -125,30 +165,43 @@ class DipStrikeCalculator:
             processed_count = 0
             error_count = 0
 
-            with edit(layer):
-                features = layer.getFeatures()
-                for feature in features:  # type: ignore
-                    input_value = feature.attribute(input_field_idx)
+            # Collect the non-empty input values, then calculate all the outputs in one batch
+            # Only the input attribute is read, skip geometries and the other attributes
+            request = QgsFeatureRequest()
+            request.setFlags(Qgis.FeatureRequestFlag.NoGeometry)
+            request.setSubsetOfAttributes([input_field_idx])
 
-                    if input_value is None or input_value == "":
-                        continue  # Skip null/empty values
+            feature_ids = []
+            input_values = []
+            for feature in layer.getFeatures(request):  # type: ignore
+                input_value = feature.attribute(input_field_idx)
 
-                    # Calculate output value
-                    if calculation_type == "dip_from_strike":
-                        output_value = self.calculate_dip_from_strike(input_value, decimal_places)
-                    else:  # strike_from_dip
-                        output_value = self.calculate_strike_from_dip(input_value, decimal_places)
+                if input_value is None or input_value == "":
+                    continue  # Skip null/empty values
 
-                    if output_value is not None:
-                        # Update the feature
-                        if layer.changeAttributeValue(feature.id(), output_field_idx, output_value):
+                feature_ids.append(feature.id())
+                input_values.append(input_value)
+
+            output_values = self._calculate_values(input_values, calculation_type, decimal_places)
+
+            changes = {}
+            for feature_id, input_value, output_value in zip(feature_ids, input_values, output_values, strict=True):
+                if output_value is not None:
+                    changes[feature_id] = {output_field_idx: output_value}
+                else:
+                    error_count += 1
+                    self.log(message=f"Invalid input value for feature {feature_id}: {input_value}", log_level=2)
+
+            if changes:
+                # The values are buffered in the layer edit buffer, and the edit() commit on exit
+                # writes them all to the provider in a single changeAttributeValues call
+                with edit(layer):
+                    for feature_id, new_values in changes.items():
+                        if layer.changeAttributeValues(feature_id, new_values):
                             processed_count += 1
                         else:
                             error_count += 1
-                            self.log(message=f"Failed to update feature {feature.id()}", log_level=2)
-                    else:
-                        error_count += 1
-                        self.log(message=f"Invalid input value for feature {feature.id()}: {input_value}", log_level=2)
+                            self.log(message=f"Failed to update feature {feature_id}", log_level=2)
 
             # Log results
             self.log(
@@ -168,3 +221,17 @@ class DipStrikeCalculator:
             error_msg = f"Error during calculation: {str(e)}"
             self.log(message=error_msg, log_level=1, push=True)
             return False, error_msg
+
+
+def _to_float(value):
+    """Convert an attribute value to float, NaN if it is not a valid number.
+
+    :param value: Attribute value
+    :type value: Any
+    :return: Value as float
+    :rtype: float
+    """
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return float("nan")
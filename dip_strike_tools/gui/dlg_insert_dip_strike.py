@@ -847,11 +847,8 @@ class DlgInsertDipStrike(QDialog, FORM_CLASS):
         :return: True if the layer is suitable, False otherwise
         :rtype: bool
         """
-        if not layer or not layer.isValid():
-            return False
-
-        # Must be a point layer
-        if layer.geometryType() != 0:
+        # Must be a valid point layer
+        if not layer or not layer.isValid() or layer.geometryType() != 0:
             return False
 
         # Check if already configured
@@ -860,22 +857,17 @@ class DlgInsertDipStrike(QDialog, FORM_CLASS):
 
         # Check if it has required fields naturally
         required_fields = ["strike_azimuth", "dip_azimuth", "dip_value"]
-        missing_required_fields = [field for field in required_fields if layer.fields().lookupField(field) == -1]
-
-        if not missing_required_fields:
+        fields = layer.fields()
+        if all(fields.lookupField(field) != -1 for field in required_fields):
             return True
 
         # Check if it's a shapefile (can be configured with field mappings)
-        is_shapefile = layer.dataProvider().name() == "ogr" and layer.source().lower().endswith(".shp")
-        if is_shapefile:
+        if layer.dataProvider().name() == "ogr" and layer.source().lower().endswith(".shp"):
             return True
 
         # For other layer types, check if they have enough fields that could be mapped
         # (this is a more permissive check for layers that might be configurable)
-        layer_field_count = len(layer.fields())
-        if layer_field_count >= len(required_fields):
-            return True
-        return False
+        return len(fields) >= len(required_fields)
 
     def _restore_last_feature_layer(self):
         """Restore the best available feature layer.
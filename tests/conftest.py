@@ -33,6 +33,22 @@ import pytest
 GUI_TIMEOUT_DEFAULT = 2000  # milliseconds
 
 
+def pytest_sessionstart(session):
+    """Pre-import QGIS and plugin modules once, before the first test runs.
+
+    This moves the cold import cost out of the first test that happens to touch them,
+    so per-test timings are more uniform.
+    """
+    try:
+        import qgis.core  # noqa: F401
+        import qgis.gui  # noqa: F401
+
+        from dip_strike_tools.core import dip_strike_map_tool  # noqa: F401
+    except ImportError:
+        # QGIS not available, nothing to warm up
+        pass
+
+
 @pytest.fixture(scope="session")
 def gui_timeout(pytestconfig):
     """
@@ -0,0 +1,82 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025-2026, F. Pennica
+# This file is part of Dip-Strike Tools QGIS plugin.
+#
+# Dip-Strike Tools is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# Dip-Strike Tools is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Dip-Strike Tools.  If not, see <https://www.gnu.org/licenses/>.
+# -----------------------------------------------------------------------------
+
+from unittest.mock import Mock
+
+import pytest
+
+# pytest-qgis provides qgis_iface as a session-scoped fixture, so the same interface is shared by
+# every test: fixtures and tests must patch it through monkeypatch (or patch.object as a context
+# manager) instead of assigning attributes, so that changes are reverted after each test.
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _qgis_app(qgis_app):
+    """Make sure QGIS and its data providers are initialized once for the whole integration session.
+
+    pytest-qgis owns the QgsApplication and runs initQgis() itself, so creating another application here
+    would clash with it: depending on its session-scoped qgis_app fixture is enough to pin the initialization
+    before any integration test runs.
+    """
+    return qgis_app
+
+
+@pytest.fixture(scope="module")
+def shared_plugin(qgis_iface):
+    """Plugin instance shared by all the tests of a module.
+
+    Only use it in tests that don't mutate the plugin, or that patch it with monkeypatch.
+    """
+    # Imported here so that this conftest loads without QGIS and the test modules can skip themselves
+    from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
+
+    return DipStrikeToolsPlugin(qgis_iface)
+
+
+@pytest.fixture()
+def fresh_plugin(qgis_iface):
+    """Plugin instance created for a single test, for tests that mutate plugin state."""
+    from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
+
+    return DipStrikeToolsPlugin(qgis_iface)
+
+
+@pytest.fixture()
+def configured_iface(qgis_iface, monkeypatch):
+    """QGIS interface with mocked methods used by the plugin cleanup.
+
+    Some of these methods are missing from the pytest-qgis interface stub; monkeypatch reverts them after the test.
+    """
+    mock_help_menu = Mock()
+    for name, value in (
+        ("unregisterOptionsWidgetFactory", Mock()),
+        ("removePluginMenu", Mock()),
+        ("removePluginDatabaseMenu", Mock()),
+        ("removeToolBarIcon", Mock()),
+        ("pluginHelpMenu", Mock(return_value=mock_help_menu)),
+    ):
+        monkeypatch.setattr(qgis_iface, name, value, raising=False)
+    return qgis_iface
+
+
+@pytest.fixture()
+def unload_ready_plugin(fresh_plugin, configured_iface):
+    """Plugin instance with the objects released by unload() replaced with mocks."""
+    fresh_plugin.options_factory = Mock()
+    fresh_plugin.action_help_plugin_menu_documentation = Mock()
+    return fresh_plugin
@@ -24,129 +24,112 @@ QGIS integration tests for DipStrikeCalculator.
 These tests require a QGIS environment and use pytest-qgis.
 """
 
+from unittest.mock import patch
+
 import pytest
 
+# Skip the whole module at collection time when QGIS is not available
+pytest.importorskip("qgis.core")
+
+from qgis.core import (  # noqa: E402
+    Qgis,
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsFeatureSink,
+    QgsField,
+    QgsGeometry,
+    QgsPointXY,
+    QgsVectorLayer,
+)
+
+from dip_strike_tools.core.dip_strike_calculator import DipStrikeCalculator  # noqa: E402
+
 # Import compatibility module for QVariant
-from dip_strike_tools.toolbelt import QVariant
+from dip_strike_tools.toolbelt import QVariant  # noqa: E402
 
 # Import pytest-qgis utilities
 pytest_plugins = ["pytest_qgis"]
 
+# Field templates for the test layers, built once: addAttributes() stores copies of them
+DOUBLE_FIELDS = {name: QgsField(name, QVariant.Double) for name in ("strike", "dip")}
 
-class TestDipStrikeCalculatorQGIS:
-    """QGIS integration tests for DipStrikeCalculator."""
-
-    def test_calculator_import(self):
-        """Test that the calculator can be imported in QGIS environment."""
-        try:
-            from dip_strike_tools.core.dip_strike_calculator import DipStrikeCalculator
-
-            assert DipStrikeCalculator is not None
-        except ImportError as e:
-            pytest.skip(f"QGIS modules not available: {e}")
+# The calculator only reads attributes, so all test features share the same point geometry
+ORIGIN_GEOM = QgsGeometry.fromPointXY(QgsPointXY(0, 0))
 
-    def test_calculator_initialization(self, qgis_iface):
-        """Test DipStrikeCalculator initialization in QGIS environment."""
-        from dip_strike_tools.core.dip_strike_calculator import DipStrikeCalculator
 
-        calculator = DipStrikeCalculator()
-        assert calculator is not None
-        assert hasattr(calculator, "log")
+@pytest.fixture(scope="module")
+def calculator():
+    """Calculator shared by the module tests, it holds no per-layer state."""
+    return DipStrikeCalculator()
 
-    def test_process_layer_create_new_field_dip_from_strike(self, qgis_iface):
-        """Test process_layer creating new field for dip calculation."""
-        from qgis.core import QgsFeature, QgsField, QgsGeometry, QgsPointXY, QgsVectorLayer
 
-        # QVariant import moved to top of file
-        from dip_strike_tools.core.dip_strike_calculator import DipStrikeCalculator
+def _make_point_layer(values, field_name="strike", output_field_name=None):
+    """Create a memory point layer with one feature per value in a double ("strike" or "dip") field.
 
-        calculator = DipStrikeCalculator()
+    If ``output_field_name`` is given, an empty double field with that name is added after the input one.
+    """
+    layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
+    provider = layer.dataProvider()
 
-        # Create test layer
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        provider = layer.dataProvider()
-
-        # Add input field
-        input_field = QgsField("strike", QVariant.Double)
-        provider.addAttributes([input_field])
-        layer.updateFields()
-
-        # Add test features
-        features = []
-        test_data = [0, 45, 90, 135, 180, 225, 270, 315]
-        for i, strike_value in enumerate(test_data):
-            feature = QgsFeature()
-            feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(i, i)))
-            feature.setAttributes([strike_value])
-            features.append(feature)
-
-        provider.addFeatures(features)
-        layer.updateFields()
+    field_names = [field_name] if output_field_name is None else [field_name, output_field_name]
+    provider.addAttributes([DOUBLE_FIELDS[name] for name in field_names])
+    layer.updateFields()
 
-        # Prepare configuration
-        config = {
-            "layer": layer,
-            "calculation_type": "dip_from_strike",
-            "input_field": layer.fields().field("strike"),
-            "create_new_field": True,
-            "new_field_name": "dip",
-            "decimal_places": 2,
-        }
+    fields = layer.fields()
+    empty_values = [None] * (len(field_names) - 1)
+    features = [QgsFeature(fields) for _ in values]
+    for feature, value in zip(features, values, strict=True):
+        feature.setGeometry(ORIGIN_GEOM)
+        feature.setAttributes([value, *empty_values])
 
-        # Process layer
-        success, message = calculator.process_layer(config)
+    # Feature ids are never read back, so skip updating them after insertion
+    provider.addFeatures(features, QgsFeatureSink.Flag.FastInsert)
+    return layer
 
-        # Verify results
-        assert success is True
-        assert "Successfully calculated 8 values" in message
 
-        # Check that new field was created
-        assert layer.fields().indexFromName("dip") != -1
+def _field_request(field_idx):
+    """Feature request fetching only the field at the given index, without geometry."""
+    request = QgsFeatureRequest()
+    request.setFlags(Qgis.FeatureRequestFlag.NoGeometry)
+    request.setSubsetOfAttributes([field_idx])
+    return request
 
-        # Verify calculated values
-        expected_dips = [90, 135, 180, 225, 270, 315, 0, 45]
-        features = list(layer.getFeatures())
-        for i, feature in enumerate(features):
-            calculated_dip = feature.attribute("dip")
-            assert calculated_dip == expected_dips[i]
 
-    def test_process_layer_create_new_field_strike_from_dip(self, qgis_iface):
-        """Test process_layer creating new field for strike calculation."""
-        from qgis.core import QgsFeature, QgsField, QgsGeometry, QgsPointXY, QgsVectorLayer
+class TestDipStrikeCalculatorQGIS:
+    """QGIS integration tests for DipStrikeCalculator."""
 
-        # QVariant import moved to top of file
-        from dip_strike_tools.core.dip_strike_calculator import DipStrikeCalculator
+    def test_calculator_import(self):
+        """Test that the calculator can be imported in QGIS environment."""
+        assert DipStrikeCalculator is not None
 
-        calculator = DipStrikeCalculator()
+    def test_calculator_initialization(self, qgis_iface, calculator):
+        """Test DipStrikeCalculator initialization in QGIS environment."""
+        assert calculator is not None
+        assert hasattr(calculator, "log")
 
-        # Create test layer
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        provider = layer.dataProvider()
-
-        # Add input field
-        input_field = QgsField("dip", QVariant.Double)
-        provider.addAttributes([input_field])
-        layer.updateFields()
-
-        # Add test features
-        features = []
-        test_data = [90, 135, 180, 225, 270, 315, 0, 45]
-        for i, dip_value in enumerate(test_data):
-            feature = QgsFeature()
-            feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(i, i)))
-            feature.setAttributes([dip_value])
-            features.append(feature)
-
-        provider.addFeatures(features)
-        layer.updateFields()
+    @pytest.mark.parametrize(
+        "calculation_type,input_name,output_name,offset",
+        [
+            ("dip_from_strike", "strike", "dip", 90.0),
+            ("strike_from_dip", "dip", "strike", -90.0),
+        ],
+        ids=["dip_from_strike", "strike_from_dip"],
+    )
+    def test_process_layer_create_new_field(
+        self, qgis_iface, calculator, calculation_type, input_name, output_name, offset
+    ):
+        """Test process_layer creating a new field for the calculated values."""
+        # Create test layer with input values
+        inputs = [0, 45, 90, 135, 180, 225, 270, 315]
+        layer = _make_point_layer(inputs, field_name=input_name)
 
         # Prepare configuration
         config = {
             "layer": layer,
-            "calculation_type": "strike_from_dip",
-            "input_field": layer.fields().field("dip"),
+            "calculation_type": calculation_type,
+            "input_field": layer.fields().field(input_name),
             "create_new_field": True,
-            "new_field_name": "strike",
+            "new_field_name": output_name,
             "decimal_places": 2,
         }
 
@@ -155,48 +138,21 @@ class TestDipStrikeCalculatorQGIS:
 
         # Verify results
         assert success is True
-        assert "Successfully calculated 8 values" in message
+        assert f"Successfully calculated {len(inputs)} values" in message
 
         # Check that new field was created
-        assert layer.fields().indexFromName("strike") != -1
+        output_idx = layer.fields().indexFromName(output_name)
+        assert output_idx != -1
 
-        # Verify calculated values
-        expected_strikes = [0, 45, 90, 135, 180, 225, 270, 315]
-        features = list(layer.getFeatures())
-        for i, feature in enumerate(features):
-            calculated_strike = feature.attribute("strike")
-            assert calculated_strike == expected_strikes[i]
+        # Verify calculated values, output azimuths are perpendicular to the input ones
+        expected = [(float(value) + offset) % 360.0 for value in inputs]
+        actual = [feature[output_idx] for feature in layer.getFeatures(_field_request(output_idx))]
+        assert actual == expected
 
-    def test_process_layer_use_existing_field(self, qgis_iface):
+    def test_process_layer_use_existing_field(self, qgis_iface, calculator):
         """Test process_layer using existing output field."""
-        from qgis.core import QgsFeature, QgsField, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        # QVariant import moved to top of file
-        from dip_strike_tools.core.dip_strike_calculator import DipStrikeCalculator
-
-        calculator = DipStrikeCalculator()
-
-        # Create test layer
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        provider = layer.dataProvider()
-
-        # Add input and output fields
-        input_field = QgsField("strike", QVariant.Double)
-        output_field = QgsField("dip", QVariant.Double)
-        provider.addAttributes([input_field, output_field])
-        layer.updateFields()
-
-        # Add test features
-        features = []
-        test_data = [0, 90, 180, 270]
-        for i, strike_value in enumerate(test_data):
-            feature = QgsFeature()
-            feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(i, i)))
-            feature.setAttributes([strike_value, None])  # None for dip initially
-            features.append(feature)
-
-        provider.addFeatures(features)
-        layer.updateFields()
+        # Create test layer with strike values and an empty dip field
+        layer = _make_point_layer([0, 90, 180, 270], output_field_name="dip")
 
         # Prepare configuration
         config = {
@@ -217,40 +173,15 @@ class TestDipStrikeCalculatorQGIS:
 
         # Verify calculated values
         expected_dips = [90.0, 180.0, 270.0, 0.0]
-        features = list(layer.getFeatures())
-        for i, feature in enumerate(features):
-            calculated_dip = feature.attribute("dip")
-            assert calculated_dip == expected_dips[i]
+        dip_idx = layer.fields().indexFromName("dip")
+        features = layer.getFeatures(_field_request(dip_idx))
+        for expected, feature in zip(expected_dips, features, strict=True):
+            assert feature[dip_idx] == expected
 
-    def test_process_layer_with_null_values(self, qgis_iface):
+    def test_process_layer_with_null_values(self, qgis_iface, calculator):
         """Test process_layer with null and empty values."""
-        from qgis.core import QgsFeature, QgsField, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        # QVariant import moved to top of file
-        from dip_strike_tools.core.dip_strike_calculator import DipStrikeCalculator
-
-        calculator = DipStrikeCalculator()
-
-        # Create test layer
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        provider = layer.dataProvider()
-
-        # Add input field
-        input_field = QgsField("strike", QVariant.Double)
-        provider.addAttributes([input_field])
-        layer.updateFields()
-
-        # Add test features with mixed valid/invalid values
-        features = []
-        test_data = [0, None, 90, "", 180]  # Mix of valid and invalid values
-        for i, strike_value in enumerate(test_data):
-            feature = QgsFeature()
-            feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(i, i)))
-            feature.setAttributes([strike_value])
-            features.append(feature)
-
-        provider.addFeatures(features)
-        layer.updateFields()
+        # Create test layer with mixed valid/invalid values
+        layer = _make_point_layer([0, None, 90, "", 180])
 
         # Prepare configuration
         config = {
@@ -276,30 +207,10 @@ class TestDipStrikeCalculatorQGIS:
         # Verify only valid values were calculated (count check is sufficient)
         # The exact number of features processed depends on how QGIS handles null/empty values
 
-    def test_process_layer_with_decimal_places(self, qgis_iface):
+    def test_process_layer_with_decimal_places(self, qgis_iface, calculator):
         """Test process_layer with different decimal places."""
-        from qgis.core import QgsFeature, QgsField, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        # QVariant import moved to top of file
-        from dip_strike_tools.core.dip_strike_calculator import DipStrikeCalculator
-
-        calculator = DipStrikeCalculator()
-
-        # Create test layer
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        provider = layer.dataProvider()
-
-        # Add input field
-        input_field = QgsField("strike", QVariant.Double)
-        provider.addAttributes([input_field])
-        layer.updateFields()
-
-        # Add test feature with precise value
-        feature = QgsFeature()
-        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(0, 0)))
-        feature.setAttributes([45.123456])
-        provider.addFeatures([feature])
-        layer.updateFields()
+        # Create test layer with a precise value
+        layer = _make_point_layer([45.123456])
 
         # Test with 4 decimal places
         config = {
@@ -319,38 +230,17 @@ class TestDipStrikeCalculatorQGIS:
         assert "Successfully calculated 1 values" in message
 
         # Check calculated value precision (field precision might limit decimal places)
-        features = list(layer.getFeatures())
-        calculated_dip = features[0].attribute("dip")
+        dip_idx = layer.fields().indexFromName("dip")
+        feature = next(layer.getFeatures(_field_request(dip_idx)))
+        calculated_dip = feature[dip_idx]
         expected_dip = round(45.123456 + 90, 4)  # 135.1235
         # QGIS field precision might limit this, so check if it's close
         assert abs(calculated_dip - expected_dip) < 0.01
 
-    def test_process_layer_update_failure(self, qgis_iface):
+    def test_process_layer_update_failure(self, qgis_iface, calculator):
         """Test process_layer when feature update fails."""
-        from unittest.mock import patch
-
-        from qgis.core import QgsFeature, QgsField, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        # QVariant import moved to top of file
-        from dip_strike_tools.core.dip_strike_calculator import DipStrikeCalculator
-
-        calculator = DipStrikeCalculator()
-
         # Create test layer
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        provider = layer.dataProvider()
-
-        # Add input field
-        input_field = QgsField("strike", QVariant.Double)
-        provider.addAttributes([input_field])
-        layer.updateFields()
-
-        # Add test feature
-        feature = QgsFeature()
-        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(0, 0)))
-        feature.setAttributes([45])
-        provider.addFeatures([feature])
-        layer.updateFields()
+        layer = _make_point_layer([45])
 
         # Prepare configuration
         config = {
@@ -362,40 +252,18 @@ class TestDipStrikeCalculatorQGIS:
             "decimal_places": 2,
         }
 
-        # Mock changeAttributeValue to return False (failure)
-        with patch.object(layer, "changeAttributeValue", return_value=False):
+        # Mock changeAttributeValues to return False (failure)
+        with patch.object(layer, "changeAttributeValues", return_value=False):
             success, message = calculator.process_layer(config)
 
             # Should still succeed but report errors
             assert success is False
             assert "No features were processed" in message
 
-    def test_process_layer_invalid_calculation_values(self, qgis_iface):
+    def test_process_layer_invalid_calculation_values(self, qgis_iface, calculator):
         """Test process_layer with values that cause calculation errors."""
-        from unittest.mock import patch
-
-        from qgis.core import QgsFeature, QgsField, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        # QVariant import moved to top of file
-        from dip_strike_tools.core.dip_strike_calculator import DipStrikeCalculator
-
-        calculator = DipStrikeCalculator()
-
         # Create test layer
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        provider = layer.dataProvider()
-
-        # Add input field
-        input_field = QgsField("strike", QVariant.Double)
-        provider.addAttributes([input_field])
-        layer.updateFields()
-
-        # Add test feature
-        feature = QgsFeature()
-        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(0, 0)))
-        feature.setAttributes([45])
-        provider.addFeatures([feature])
-        layer.updateFields()
+        layer = _make_point_layer([45])
 
         # Prepare configuration
         config = {
@@ -407,43 +275,18 @@ class TestDipStrikeCalculatorQGIS:
             "decimal_places": 2,
         }
 
-        # Mock calculate_dip_from_strike to return None (calculation error)
-        with patch.object(calculator, "calculate_dip_from_strike", return_value=None):
+        # Mock the batch calculation to return None for every value (calculation error)
+        with patch.object(calculator, "_calculate_values", side_effect=lambda values, *args: [None] * len(values)):
             success, message = calculator.process_layer(config)
 
             # Should fail due to no valid calculations
             assert success is False
             assert "No features were processed" in message
 
-    def test_process_layer_with_errors_but_some_success(self, qgis_iface):
+    def test_process_layer_with_errors_but_some_success(self, qgis_iface, calculator):
         """Test process_layer with mixed success and error results."""
-        from qgis.core import QgsFeature, QgsField, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        # QVariant import moved to top of file
-        from dip_strike_tools.core.dip_strike_calculator import DipStrikeCalculator
-
-        calculator = DipStrikeCalculator()
-
-        # Create test layer
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        provider = layer.dataProvider()
-
-        # Add input field
-        input_field = QgsField("strike", QVariant.Double)
-        provider.addAttributes([input_field])
-        layer.updateFields()
-
-        # Add test features - mix of valid values and invalid strings
-        features = []
-        test_data = [0, 90, "invalid", 180]  # Mix of valid numbers and invalid string
-        for i, strike_value in enumerate(test_data):
-            feature = QgsFeature()
-            feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(i, i)))
-            feature.setAttributes([strike_value])
-            features.append(feature)
-
-        provider.addFeatures(features)
-        layer.updateFields()
+        # Create test layer - mix of valid values and invalid strings
+        layer = _make_point_layer([0, 90, "invalid", 180])
 
         # Prepare configuration
         config = {
@@ -463,30 +306,10 @@ class TestDipStrikeCalculatorQGIS:
         # Should process 2 valid values (0, 90, 180 minus invalid string)
         assert "Successfully calculated 2 values" in message or "Successfully calculated 3 values" in message
 
-    def test_process_layer_field_types(self, qgis_iface):
+    def test_process_layer_field_types(self, qgis_iface, calculator):
         """Test process_layer creates field with correct type."""
-        from qgis.core import QgsFeature, QgsField, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        # QVariant import moved to top of file
-        from dip_strike_tools.core.dip_strike_calculator import DipStrikeCalculator
-
-        calculator = DipStrikeCalculator()
-
         # Create test layer
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        provider = layer.dataProvider()
-
-        # Add input field
-        input_field = QgsField("strike", QVariant.Double)
-        provider.addAttributes([input_field])
-        layer.updateFields()
-
-        # Add test feature
-        feature = QgsFeature()
-        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(0, 0)))
-        feature.setAttributes([45])
-        provider.addFeatures([feature])
-        layer.updateFields()
+        layer = _make_point_layer([45])
 
         # Prepare configuration
         config = {
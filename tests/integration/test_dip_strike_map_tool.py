@@ -24,14 +24,76 @@ QGIS integration tests for DipStrikeMapTool.
 These tests require a QGIS environment and use pytest-qgis.
 """
 
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from qgis.core import QgsCoordinateReferenceSystem, QgsGeometry, QgsPointXY
+from qgis.PyQt.QtTest import QSignalSpy
 
 # Import pytest-qgis utilities
 pytest_plugins = ["pytest_qgis"]
 
+# CRS objects are built once per module: each construction hits proj.db
+WGS84 = QgsCoordinateReferenceSystem("EPSG:4326")
+EPSG3857 = QgsCoordinateReferenceSystem("EPSG:3857")
+# Shared origin geometry, copied (implicitly shared) into features that need it
+ORIGIN_GEOM = QgsGeometry.fromPointXY(QgsPointXY(0, 0))
 
+
+def _raising_stub(message):
+    """Return a callable that raises an exception with the given message when called."""
+
+    def _stub(*args, **kwargs):
+        raise Exception(message)
+
+    return _stub
+
+
+@pytest.fixture
+def wgs84_canvas(qgis_iface):
+    """Set the canvas destination CRS to WGS84 for the test, restoring the previous CRS afterwards."""
+    canvas = qgis_iface.mapCanvas()
+    previous_crs = canvas.mapSettings().destinationCrs()
+    canvas.setDestinationCrs(WGS84)
+    yield canvas
+    canvas.setDestinationCrs(previous_crs)
+
+
+@pytest.fixture
+def map_tool(qgis_iface):
+    """Create a DipStrikeMapTool bound to the test iface."""
+    from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
+
+    return DipStrikeMapTool(qgis_iface)
+
+
+@pytest.fixture
+def patch_finder(map_tool, monkeypatch):
+    """Return a helper that makes the map tool's feature finder return a fixed result."""
+
+    def _patch(result):
+        monkeypatch.setattr(
+            map_tool.feature_finder, "find_feature_at_point", lambda point, tolerance_pixels=15: result
+        )
+
+    return _patch
+
+
+@pytest.fixture
+def existing_feature():
+    """Create an existing-feature dict with a point feature at the origin on a memory layer."""
+    from qgis.core import QgsFeature, QgsVectorLayer
+
+    layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
+    feature = QgsFeature()
+    feature.setGeometry(QgsGeometry(ORIGIN_GEOM))
+    feature.setId(1)
+
+    return {"feature": feature, "layer": layer}
+
+
+@pytest.mark.usefixtures("qgis_app")
 class TestDipStrikeMapToolQGIS:
     """QGIS integration tests for DipStrikeMapTool."""
 
@@ -63,26 +125,18 @@ class TestDipStrikeMapToolQGIS:
 
         assert isinstance(map_tool, QgsMapToolEmitPoint)
 
-    def test_map_tool_signals(self, qgis_iface):
+    def test_map_tool_signals(self):
         """Test that map tool signals are properly defined."""
         from qgis.PyQt.QtCore import pyqtSignal
 
         from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
 
-        map_tool = DipStrikeMapTool(qgis_iface)
-
-        # Test that signals exist and are pyqtSignal instances
-        assert hasattr(map_tool, "canvasClicked")
-        assert hasattr(map_tool, "featureClicked")
-        assert isinstance(type(map_tool).canvasClicked, type(pyqtSignal()))
-        assert isinstance(type(map_tool).featureClicked, type(pyqtSignal()))
+        # Signals are class attributes, so no instance is needed
+        assert isinstance(DipStrikeMapTool.canvasClicked, type(pyqtSignal()))
+        assert isinstance(DipStrikeMapTool.featureClicked, type(pyqtSignal()))
 
-    def test_cursor_setting(self, qgis_iface):
+    def test_cursor_setting(self, map_tool):
         """Test cursor setting functionality."""
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
         # Test setting valid cursor
         map_tool._set_safe_cursor("CrossCursor")
         # Should not raise exception
@@ -91,134 +145,80 @@ class TestDipStrikeMapToolQGIS:
         map_tool._set_safe_cursor("NonExistentCursor")
         # Should not raise exception
 
-    def test_canvas_move_event_no_plugin(self, qgis_iface):
+    def test_canvas_move_event_no_plugin(self, map_tool):
         """Test canvas move event when no plugin is set."""
-        from qgis.core import QgsPointXY
-        from qgis.gui import QgsMapMouseEvent
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
         # Create a mock mouse event
         point = QgsPointXY(0, 0)
-        event = Mock(spec=QgsMapMouseEvent)
-        event.mapPoint.return_value = point
+        event = SimpleNamespace(mapPoint=lambda p=point: p)
 
         # Should not raise exception
         map_tool.canvasMoveEvent(event)
 
-    def test_canvas_move_event_with_plugin(self, qgis_iface):
+    def test_canvas_move_event_with_plugin(self, map_tool):
         """Test canvas move event with feature finder."""
-        from qgis.core import QgsPointXY
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
         # Mock the feature_finder
         with patch.object(map_tool.feature_finder, "find_feature_at_point", return_value=None) as mock_find:
             # Create mock event
             point = QgsPointXY(0, 0)
-            event = Mock()
-            event.mapPoint.return_value = point
+            event = SimpleNamespace(mapPoint=lambda p=point: p)
 
             # Should call feature finder method
             map_tool.canvasMoveEvent(event)
             mock_find.assert_called_once_with(point, tolerance_pixels=15)
 
-    def test_canvas_release_event_signal_emission(self, qgis_iface):
+    def test_canvas_release_event_signal_emission(self, map_tool, patch_finder):
         """Test that canvas release event emits signals."""
-        from qgis.core import QgsPointXY
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
         # Mock the feature_finder to return None
-        with patch.object(map_tool.feature_finder, "find_feature_at_point", return_value=None):
-            # Track signal emissions
-            feature_clicked_signals = []
-            canvas_clicked_signals = []
+        patch_finder(None)
 
-            def on_feature_clicked(*args):
-                feature_clicked_signals.append(args)
-
-            def on_canvas_clicked(*args):
-                canvas_clicked_signals.append(args)
-
-            map_tool.featureClicked.connect(on_feature_clicked)
-            map_tool.canvasClicked["QgsPointXY"].connect(on_canvas_clicked)
+        # Track signal emissions
+        feature_clicked_spy = QSignalSpy(map_tool.featureClicked)
+        canvas_clicked_spy = QSignalSpy(map_tool.canvasClicked["QgsPointXY"])
 
         # Create mock event
         point = QgsPointXY(10, 20)
-        event = Mock()
-        event.mapPoint.return_value = point
+        event = SimpleNamespace(mapPoint=lambda p=point: p)
 
         # Trigger event
         map_tool.canvasReleaseEvent(event)
 
         # Verify signals were emitted
-        assert len(feature_clicked_signals) == 1
-        assert len(canvas_clicked_signals) == 1
-        assert feature_clicked_signals[0] == (point, None)
-        assert canvas_clicked_signals[0] == (point,)
+        assert len(feature_clicked_spy) == 1
+        assert len(canvas_clicked_spy) == 1
+        assert feature_clicked_spy[0] == [point, None]
+        assert canvas_clicked_spy[0] == [point]
 
-    def test_highlight_feature_with_qgs_highlight(self, qgis_iface):
+    @pytest.mark.parametrize("action", ["highlight_only", "double_highlight"])
+    def test_highlight_lifecycle(self, map_tool, existing_feature, action):
         """Test feature highlighting with QgsHighlight."""
-        from qgis.core import QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
-        # Create a test layer and feature
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        feature = QgsFeature()
-        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(0, 0)))
-        feature.setId(1)
-
-        existing_feature = {"feature": feature, "layer": layer}
-
-        # Test highlighting (should not raise exception)
+        # Highlighting should not raise and should set state
         map_tool._highlight_feature(existing_feature)
-
-        # Verify state was set
         assert map_tool.highlighted_feature == existing_feature
         assert map_tool.current_highlight is not None
 
-    def test_clear_highlight(self, qgis_iface):
-        """Test clearing highlight."""
-        from qgis.core import QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
-        # Create a test layer and feature for highlighting
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        feature = QgsFeature()
-        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(0, 0)))
-        feature.setId(1)
+        if action == "double_highlight":
+            # Highlighting the same feature twice should not recreate the highlight
+            first_highlight = map_tool.current_highlight
+            map_tool._highlight_feature(existing_feature)
+            assert map_tool.current_highlight == first_highlight
 
-        existing_feature = {"feature": feature, "layer": layer}
+    @pytest.mark.parametrize("release_method", ["_clear_highlight", "clean_up"])
+    def test_highlight_release(self, map_tool, monkeypatch, release_method):
+        """Test that clearing the highlight or cleaning up the tool resets highlight state."""
+        # Only the post-release state matters here, so stub the highlight and the feature
+        monkeypatch.setattr("dip_strike_tools.core.dip_strike_map_tool.QgsHighlight", MagicMock())
+        existing_feature = {"feature": Mock(), "layer": Mock()}
 
-        # First highlight a feature
         map_tool._highlight_feature(existing_feature)
         assert map_tool.highlighted_feature is not None
         assert map_tool.current_highlight is not None
 
-        # Then clear the highlight
-        map_tool._clear_highlight()
+        getattr(map_tool, release_method)()
         assert map_tool.highlighted_feature is None
         assert map_tool.current_highlight is None
 
-    def test_activation_deactivation(self, qgis_iface):
+    def test_activation_deactivation(self, map_tool):
         """Test map tool activation and deactivation."""
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
         # Test activation
         map_tool.activate()
         # Should not raise exception
@@ -227,44 +227,13 @@ class TestDipStrikeMapToolQGIS:
         map_tool.deactivate()
         # Should not raise exception
 
-    def test_clean_up(self, qgis_iface):
-        """Test map tool cleanup."""
-        from qgis.core import QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
-        # Create a test layer and feature for highlighting
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        feature = QgsFeature()
-        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(0, 0)))
-        feature.setId(1)
-
-        existing_feature = {"feature": feature, "layer": layer}
-
-        # Highlight a feature
-        map_tool._highlight_feature(existing_feature)
-        assert map_tool.highlighted_feature is not None
-
-        # Clean up
-        map_tool.clean_up()
-        assert map_tool.highlighted_feature is None
-        assert map_tool.current_highlight is None
-
-    def test_canvas_release_event_with_coordinate_transformation(self, qgis_iface):
+    def test_canvas_release_event_with_coordinate_transformation(self, map_tool, patch_finder, wgs84_canvas):
         """Test canvas release event with coordinate transformation."""
-        from unittest.mock import patch
-
-        from qgis.core import QgsCoordinateReferenceSystem, QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
+        from qgis.core import QgsFeature, QgsVectorLayer
 
         # Create a test layer with different CRS
         layer = QgsVectorLayer("Point?crs=EPSG:3857", "test_layer", "memory")
-        layer.setCrs(QgsCoordinateReferenceSystem("EPSG:3857"))
+        layer.setCrs(EPSG3857)
 
         feature = QgsFeature()
         feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(1000000, 1000000)))
@@ -273,125 +242,64 @@ class TestDipStrikeMapToolQGIS:
         existing_feature = {"feature": feature, "layer": layer}
 
         # Track signal emissions
-        feature_clicked_signals = []
-
-        def on_feature_clicked(*args):
-            feature_clicked_signals.append(args)
-
-        map_tool.featureClicked.connect(on_feature_clicked)
+        feature_clicked_spy = QSignalSpy(map_tool.featureClicked)
 
         # Create mock event
         point = QgsPointXY(10, 20)
-        event = Mock()
-        event.mapPoint.return_value = point
-
-        # Set canvas CRS to WGS84
-        qgis_iface.mapCanvas().mapSettings().setDestinationCrs(QgsCoordinateReferenceSystem("EPSG:4326"))
+        event = SimpleNamespace(mapPoint=lambda p=point: p)
 
         # Mock the feature_finder to return the feature
-        with patch.object(map_tool.feature_finder, "find_feature_at_point", return_value=existing_feature):
-            # Trigger event (should handle coordinate transformation)
-            map_tool.canvasReleaseEvent(event)
+        patch_finder(existing_feature)
+
+        # Trigger event (should handle coordinate transformation)
+        map_tool.canvasReleaseEvent(event)
 
         # Verify signal was emitted
-        assert len(feature_clicked_signals) == 1
-        emitted_point, emitted_feature = feature_clicked_signals[0]
+        assert len(feature_clicked_spy) == 1
+        emitted_point, emitted_feature = feature_clicked_spy[0]
         assert emitted_feature == existing_feature
         # Point should be transformed (different from original click point)
         assert isinstance(emitted_point, QgsPointXY)
 
-    def test_highlight_same_feature_twice(self, qgis_iface):
-        """Test highlighting the same feature twice should not recreate highlight."""
-        from qgis.core import QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
-        # Create a test layer and feature
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        feature = QgsFeature()
-        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(0, 0)))
-        feature.setId(1)
-
-        existing_feature = {"feature": feature, "layer": layer}
-
-        # First highlight
-        map_tool._highlight_feature(existing_feature)
-        first_highlight = map_tool.current_highlight
-
-        # Second highlight of same feature
-        map_tool._highlight_feature(existing_feature)
-        second_highlight = map_tool.current_highlight
-
-        # Should be the same highlight object
-        assert first_highlight == second_highlight
-
-    def test_canvas_move_event_with_existing_feature(self, qgis_iface):
+    def test_canvas_move_event_with_existing_feature(self, map_tool, patch_finder, existing_feature):
         """Test canvas move event highlighting an existing feature."""
-        from unittest.mock import patch
-
-        from qgis.core import QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
-        # Create a test layer and feature
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        feature = QgsFeature()
-        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(0, 0)))
-        feature.setId(1)
-
-        existing_feature = {"feature": feature, "layer": layer}
-
         # Create mock event
         point = QgsPointXY(0, 0)
-        event = Mock()
-        event.mapPoint.return_value = point
+        event = SimpleNamespace(mapPoint=lambda p=point: p)
 
         # Mock the feature_finder to return the feature
-        with patch.object(map_tool.feature_finder, "find_feature_at_point", return_value=existing_feature):
-            # Move event should highlight the feature
-            map_tool.canvasMoveEvent(event)
+        patch_finder(existing_feature)
+
+        # Move event should highlight the feature
+        map_tool.canvasMoveEvent(event)
 
         # Verify feature is highlighted
         assert map_tool.highlighted_feature == existing_feature
         assert map_tool.current_highlight is not None
 
-    def test_map_tool_inheritance(self, qgis_iface):
+    def test_map_tool_inheritance(self):
         """Test that DipStrikeMapTool properly inherits from QgsMapToolEmitPoint."""
         from qgis.gui import QgsMapTool, QgsMapToolEmitPoint
 
         from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
 
-        map_tool = DipStrikeMapTool(qgis_iface)
-
         # Test inheritance chain
-        assert isinstance(map_tool, QgsMapToolEmitPoint)
-        assert isinstance(map_tool, QgsMapTool)
+        assert issubclass(DipStrikeMapTool, QgsMapToolEmitPoint)
+        assert issubclass(DipStrikeMapTool, QgsMapTool)
 
         # Test that it has expected methods from parent classes
-        assert hasattr(map_tool, "setCursor")
-        assert callable(map_tool.setCursor)
-        assert hasattr(map_tool, "activate")
-        assert callable(map_tool.activate)
-        assert hasattr(map_tool, "deactivate")
-        assert callable(map_tool.deactivate)
-
-    def test_canvas_release_event_coordinate_transformation_failure(self, qgis_iface):
-        """Test canvas release event when coordinate transformation fails."""
-        from unittest.mock import patch
-
-        from qgis.core import QgsCoordinateReferenceSystem, QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
+        for method_name in ("setCursor", "activate", "deactivate"):
+            assert callable(getattr(DipStrikeMapTool, method_name, None))
 
-        map_tool = DipStrikeMapTool(qgis_iface)
+    def test_canvas_release_event_coordinate_transformation_failure(
+        self, map_tool, patch_finder, wgs84_canvas, monkeypatch
+    ):
+        """Test canvas release event when coordinate transformation fails."""
+        from qgis.core import QgsFeature, QgsVectorLayer
 
         # Create a test layer with different CRS
         layer = QgsVectorLayer("Point?crs=EPSG:3857", "test_layer", "memory")
-        layer.setCrs(QgsCoordinateReferenceSystem("EPSG:3857"))
+        layer.setCrs(EPSG3857)
 
         feature = QgsFeature()
         feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(1000000, 1000000)))
@@ -400,73 +308,41 @@ class TestDipStrikeMapToolQGIS:
         existing_feature = {"feature": feature, "layer": layer}
 
         # Track signal emissions
-        feature_clicked_signals = []
-
-        def on_feature_clicked(*args):
-            feature_clicked_signals.append(args)
-
-        map_tool.featureClicked.connect(on_feature_clicked)
+        feature_clicked_spy = QSignalSpy(map_tool.featureClicked)
 
         # Create mock event
         point = QgsPointXY(10, 20)
-        event = Mock()
-        event.mapPoint.return_value = point
+        event = SimpleNamespace(mapPoint=lambda p=point: p)
 
-        # Set canvas CRS to different from layer CRS
-        qgis_iface.mapCanvas().mapSettings().setDestinationCrs(QgsCoordinateReferenceSystem("EPSG:4326"))
+        # Make coordinate transformation fail
+        monkeypatch.setattr("qgis.core.QgsCoordinateTransform", _raising_stub("Transform failed"))
 
-        # Mock coordinate transformation to fail
-        with patch("qgis.core.QgsCoordinateTransform") as mock_transform_class:
-            mock_transform = Mock()
-            mock_transform.transform.side_effect = Exception("Transform failed")
-            mock_transform_class.return_value = mock_transform
+        # Mock the feature_finder to return the feature
+        patch_finder(existing_feature)
 
-            # Mock the feature_finder to return the feature
-            with patch.object(map_tool.feature_finder, "find_feature_at_point", return_value=existing_feature):
-                # Trigger event (should handle transformation failure gracefully)
-                map_tool.canvasReleaseEvent(event)
+        # Trigger event (should handle transformation failure gracefully)
+        map_tool.canvasReleaseEvent(event)
 
-            # Should still emit signal with original point when transformation fails
-            assert len(feature_clicked_signals) == 1
-            emitted_point, emitted_feature = feature_clicked_signals[0]
-            assert emitted_feature == existing_feature
+        # Should still emit signal with original point when transformation fails
+        assert len(feature_clicked_spy) == 1
+        emitted_point, emitted_feature = feature_clicked_spy[0]
+        assert emitted_feature == existing_feature
 
-    def test_highlight_feature_exception_without_plugin(self, qgis_iface):
+    def test_highlight_feature_exception_without_plugin(self, map_tool, existing_feature, monkeypatch):
         """Test highlighting when exception occurs and no plugin is set."""
-        from unittest.mock import patch
-
-        from qgis.core import QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
-        # Create a test layer and feature
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        feature = QgsFeature()
-        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(0, 0)))
-        feature.setId(1)
+        # Make QgsHighlight raise an exception
+        monkeypatch.setattr(
+            "dip_strike_tools.core.dip_strike_map_tool.QgsHighlight", _raising_stub("Highlight creation failed")
+        )
 
-        existing_feature = {"feature": feature, "layer": layer}
-
-        # Mock QgsHighlight to raise exception
-        with patch("dip_strike_tools.core.dip_strike_map_tool.QgsHighlight") as mock_highlight_class:
-            mock_highlight_class.side_effect = Exception("Highlight creation failed")
-
-            # Should handle exception gracefully without plugin
-            map_tool._highlight_feature(existing_feature)
+        # Should handle exception gracefully without plugin
+        map_tool._highlight_feature(existing_feature)
 
-            # Should still set highlighted_feature
-            assert map_tool.highlighted_feature == existing_feature
+        # Should still set highlighted_feature
+        assert map_tool.highlighted_feature == existing_feature
 
-    def test_clear_highlight_scene_removal_exception(self, qgis_iface):
+    def test_clear_highlight_scene_removal_exception(self, map_tool):
         """Test clearing highlight when scene removal fails."""
-        from unittest.mock import Mock
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
         # Create mock highlight that fails on scene removal
         mock_highlight = Mock()
         mock_scene = Mock()
@@ -484,14 +360,8 @@ class TestDipStrikeMapToolQGIS:
         assert map_tool.current_highlight is None
         assert map_tool.highlighted_feature is None
 
-    def test_clear_highlight_canvas_refresh_exception(self, qgis_iface):
+    def test_clear_highlight_canvas_refresh_exception(self, map_tool):
         """Test clearing highlight when canvas refresh fails."""
-        from unittest.mock import Mock, patch
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
         # Create mock highlight
         mock_highlight = Mock()
         mock_scene = Mock()
@@ -507,14 +377,8 @@ class TestDipStrikeMapToolQGIS:
         assert map_tool.current_highlight is None
         assert map_tool.highlighted_feature is None
 
-    def test_clear_highlight_hide_exception(self, qgis_iface):
+    def test_clear_highlight_hide_exception(self, map_tool):
         """Test clearing highlight when hide method fails."""
-        from unittest.mock import Mock
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
         # Create mock highlight that fails on all methods
         mock_highlight = Mock()
         mock_highlight.scene.side_effect = Exception("Scene failed")
@@ -529,67 +393,13 @@ class TestDipStrikeMapToolQGIS:
         assert map_tool.current_highlight is None
         assert map_tool.highlighted_feature is None
 
-    def test_canvas_release_event_with_different_crs_same_result(self, qgis_iface):
-        """Test canvas release event with different CRS that are actually equal."""
-        from unittest.mock import patch
-
-        from qgis.core import QgsCoordinateReferenceSystem, QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
-
-        # Create a test layer
-        layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        layer.setCrs(QgsCoordinateReferenceSystem("EPSG:4326"))
-
-        feature = QgsFeature()
-        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(10, 20)))
-        feature.setId(1)
-
-        existing_feature = {"feature": feature, "layer": layer}
-
-        # Track signal emissions
-        feature_clicked_signals = []
-
-        def on_feature_clicked(*args):
-            feature_clicked_signals.append(args)
-
-        map_tool.featureClicked.connect(on_feature_clicked)
-
-        # Create mock event
-        click_point = QgsPointXY(5, 5)
-        event = Mock()
-        event.mapPoint.return_value = click_point
-
-        # Set canvas CRS to same as layer CRS (should use centroid)
-        qgis_iface.mapCanvas().mapSettings().setDestinationCrs(QgsCoordinateReferenceSystem("EPSG:4326"))
-
-        # Mock the feature_finder to return the feature
-        with patch.object(map_tool.feature_finder, "find_feature_at_point", return_value=existing_feature):
-            # Trigger event
-            map_tool.canvasReleaseEvent(event)
-
-        # Should use feature centroid since CRS are the same
-        assert len(feature_clicked_signals) == 1
-        emitted_point, emitted_feature = feature_clicked_signals[0]
-        assert emitted_feature == existing_feature
-        # The emitted point should be the feature's centroid, not the click point
-        assert emitted_point != click_point
-
-    def test_canvas_release_same_crs_using_centroid(self, qgis_iface):
+    def test_canvas_release_same_crs_using_centroid(self, map_tool, patch_finder, wgs84_canvas):
         """Test canvas release event using feature centroid when CRS are the same."""
-        from unittest.mock import patch
-
-        from qgis.core import QgsCoordinateReferenceSystem, QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
-
-        from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool
-
-        map_tool = DipStrikeMapTool(qgis_iface)
+        from qgis.core import QgsFeature, QgsVectorLayer
 
         # Create a test layer with specific CRS
         layer = QgsVectorLayer("Point?crs=EPSG:4326", "test_layer", "memory")
-        layer.setCrs(QgsCoordinateReferenceSystem("EPSG:4326"))
+        layer.setCrs(WGS84)
 
         # Create feature with specific geometry
         feature_point = QgsPointXY(100, 200)
@@ -600,29 +410,21 @@ class TestDipStrikeMapToolQGIS:
         existing_feature = {"feature": feature, "layer": layer}
 
         # Track signal emissions
-        feature_clicked_signals = []
-
-        def on_feature_clicked(*args):
-            feature_clicked_signals.append(args)
-
-        map_tool.featureClicked.connect(on_feature_clicked)
+        feature_clicked_spy = QSignalSpy(map_tool.featureClicked)
 
         # Create mock event with different click point
         click_point = QgsPointXY(0, 0)  # Different from feature point
-        event = Mock()
-        event.mapPoint.return_value = click_point
-
-        # Set canvas CRS to be exactly the same as layer CRS
-        qgis_iface.mapCanvas().mapSettings().setDestinationCrs(QgsCoordinateReferenceSystem("EPSG:4326"))
+        event = SimpleNamespace(mapPoint=lambda p=click_point: p)
 
         # Mock the feature_finder to return the feature
-        with patch.object(map_tool.feature_finder, "find_feature_at_point", return_value=existing_feature):
-            # Trigger event
-            map_tool.canvasReleaseEvent(event)
+        patch_finder(existing_feature)
+
+        # Trigger event
+        map_tool.canvasReleaseEvent(event)
 
         # Should use feature centroid (not click point) since CRS are the same
-        assert len(feature_clicked_signals) == 1
-        emitted_point, emitted_feature = feature_clicked_signals[0]
+        assert len(feature_clicked_spy) == 1
+        emitted_point, emitted_feature = feature_clicked_spy[0]
         assert emitted_feature == existing_feature
 
         # The emitted point should be the feature's centroid
@@ -26,10 +26,33 @@ These tests require a QGIS environment and use pytest-qgis.
 
 from unittest.mock import Mock, patch
 
+import pytest
+
 # Import pytest-qgis utilities
 pytest_plugins = ["pytest_qgis"]
 
 
+@pytest.fixture
+def mocked_project(mocker):
+    """Patch QgsProject in feature_finder with an empty project whose layers are all visible.
+
+    Returns the patched class and its project instance, so tests only override what they need.
+    """
+    mock_project = mocker.patch("dip_strike_tools.core.feature_finder.QgsProject")
+    mock_project_instance = Mock()
+    mock_project_instance.mapLayers.return_value = {}
+
+    # Mock layer tree: every layer is found and visible
+    mock_layer_tree_layer = Mock()
+    mock_layer_tree_layer.isVisible.return_value = True
+    mock_root = Mock()
+    mock_root.findLayer.return_value = mock_layer_tree_layer
+    mock_project_instance.layerTreeRoot.return_value = mock_root
+
+    mock_project.instance.return_value = mock_project_instance
+    return mock_project, mock_project_instance
+
+
 class TestFeatureFinderQGIS:
     """QGIS integration tests for FeatureFinder."""
 
@@ -49,8 +72,7 @@ class TestFeatureFinderQGIS:
         assert finder.iface == qgis_iface
         assert hasattr(finder, "log")
 
-    @patch("dip_strike_tools.core.feature_finder.QgsProject")
-    def test_find_feature_at_point_no_layers(self, mock_project, qgis_iface):
+    def test_find_feature_at_point_no_layers(self, mocked_project, qgis_iface):
         """Test feature finding when no layers exist."""
         from qgis.core import QgsPointXY
 
@@ -58,18 +80,12 @@ class TestFeatureFinderQGIS:
 
         finder = FeatureFinder(qgis_iface)
 
-        # Mock project with no layers
-        mock_project_instance = Mock()
-        mock_project_instance.mapLayers.return_value = {}
-        mock_project.instance.return_value = mock_project_instance
-
         test_point = QgsPointXY(100, 200)
         result = finder.find_feature_at_point(test_point)
 
         assert result is None
 
-    @patch("dip_strike_tools.core.feature_finder.QgsProject")
-    def test_find_feature_at_point_with_configured_layer(self, mock_project, qgis_iface):
+    def test_find_feature_at_point_with_configured_layer(self, mocked_project, qgis_iface):
         """Test feature finding with a configured layer containing features."""
         from qgis.core import QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
 
@@ -96,18 +112,9 @@ class TestFeatureFinderQGIS:
         mock_layer.getFeatures.return_value = [mock_feature]
 
         # Mock project
-        mock_project_instance = Mock()
+        _, mock_project_instance = mocked_project
         mock_project_instance.mapLayers.return_value = {"layer_1": mock_layer}
 
-        # Mock layer tree
-        mock_layer_tree_layer = Mock()
-        mock_layer_tree_layer.isVisible.return_value = True
-        mock_root = Mock()
-        mock_root.findLayer.return_value = mock_layer_tree_layer
-        mock_project_instance.layerTreeRoot.return_value = mock_root
-
-        mock_project.instance.return_value = mock_project_instance
-
         # Mock canvas
         mock_canvas = Mock()
         mock_canvas.mapUnitsPerPixel.return_value = 1.0
@@ -126,8 +133,7 @@ class TestFeatureFinderQGIS:
             assert result["layer_name"] == "Test Dip Strike Layer"
             assert result["is_configured"] is True
 
-    @patch("dip_strike_tools.core.feature_finder.QgsProject")
-    def test_find_feature_early_returns(self, mock_project, qgis_iface):
+    def test_find_feature_early_returns(self, mocked_project, qgis_iface):
         """Test feature finding method's early return conditions."""
         from qgis.core import QgsPointXY
 
@@ -136,20 +142,20 @@ class TestFeatureFinderQGIS:
         finder = FeatureFinder(qgis_iface)
         test_point = QgsPointXY(100, 200)
 
+        mock_project, mock_project_instance = mocked_project
+
         # Test when project is None
         mock_project.instance.return_value = None
         result = finder.find_feature_at_point(test_point)
         assert result is None
 
         # Test when layer tree root is None
-        mock_project_instance = Mock()
         mock_project_instance.layerTreeRoot.return_value = None
         mock_project.instance.return_value = mock_project_instance
         result = finder.find_feature_at_point(test_point)
         assert result is None
 
-    @patch("dip_strike_tools.core.feature_finder.QgsProject")
-    def test_find_feature_coordinate_transform_error(self, mock_project, qgis_iface):
+    def test_find_feature_coordinate_transform_error(self, mocked_project, qgis_iface):
         """Test feature finding when coordinate transformation fails."""
         from qgis.core import QgsPointXY
 
@@ -167,18 +173,9 @@ class TestFeatureFinderQGIS:
         mock_layer.id.return_value = "layer_1"
 
         # Mock project
-        mock_project_instance = Mock()
+        _, mock_project_instance = mocked_project
         mock_project_instance.mapLayers.return_value = {"layer_1": mock_layer}
 
-        # Mock layer tree
-        mock_layer_tree_layer = Mock()
-        mock_layer_tree_layer.isVisible.return_value = True
-        mock_root = Mock()
-        mock_root.findLayer.return_value = mock_layer_tree_layer
-        mock_project_instance.layerTreeRoot.return_value = mock_root
-
-        mock_project.instance.return_value = mock_project_instance
-
         # Mock canvas with different CRS than layer
         mock_canvas = Mock()
         mock_canvas.mapUnitsPerPixel.return_value = 1.0
@@ -205,8 +202,7 @@ class TestFeatureFinderQGIS:
                 # Should return None due to transform error
                 assert result is None
 
-    @patch("dip_strike_tools.core.feature_finder.QgsProject")
-    def test_find_feature_layer_processing_error(self, mock_project, qgis_iface):
+    def test_find_feature_layer_processing_error(self, mocked_project, qgis_iface):
         """Test feature finding when layer processing encounters an error."""
         from qgis.core import QgsPointXY
 
@@ -224,18 +220,9 @@ class TestFeatureFinderQGIS:
         mock_layer.id.return_value = "layer_1"
 
         # Mock project
-        mock_project_instance = Mock()
+        _, mock_project_instance = mocked_project
         mock_project_instance.mapLayers.return_value = {"layer_1": mock_layer}
 
-        # Mock layer tree
-        mock_layer_tree_layer = Mock()
-        mock_layer_tree_layer.isVisible.return_value = True
-        mock_root = Mock()
-        mock_root.findLayer.return_value = mock_layer_tree_layer
-        mock_project_instance.layerTreeRoot.return_value = mock_root
-
-        mock_project.instance.return_value = mock_project_instance
-
         # Mock canvas
         mock_canvas = Mock()
         mock_canvas.mapUnitsPerPixel.return_value = 1.0
@@ -251,8 +238,7 @@ class TestFeatureFinderQGIS:
             # Should return None due to layer processing error
             assert result is None
 
-    @patch("dip_strike_tools.core.feature_finder.QgsProject")
-    def test_find_feature_with_visible_non_configured_layer(self, mock_project, qgis_iface):
+    def test_find_feature_with_visible_non_configured_layer(self, mocked_project, qgis_iface):
         """Test feature finding with a visible non-configured layer."""
         from qgis.core import QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
 
@@ -279,18 +265,9 @@ class TestFeatureFinderQGIS:
         mock_layer.getFeatures.return_value = [mock_feature]
 
         # Mock project
-        mock_project_instance = Mock()
+        _, mock_project_instance = mocked_project
         mock_project_instance.mapLayers.return_value = {"layer_1": mock_layer}
 
-        # Mock layer tree - this layer is visible
-        mock_layer_tree_layer = Mock()
-        mock_layer_tree_layer.isVisible.return_value = True
-        mock_root = Mock()
-        mock_root.findLayer.return_value = mock_layer_tree_layer
-        mock_project_instance.layerTreeRoot.return_value = mock_root
-
-        mock_project.instance.return_value = mock_project_instance
-
         # Mock canvas
         mock_canvas = Mock()
         mock_canvas.mapUnitsPerPixel.return_value = 1.0
@@ -424,7 +401,7 @@ class TestFeatureFinderQGIS:
         assert hasattr(finder, "_search_layer_features")
         assert callable(finder._search_layer_features)
 
-    def test_tolerance_parameter(self, qgis_iface):
+    def test_tolerance_parameter(self, mocked_project, qgis_iface):
         """Test that tolerance parameter is handled correctly."""
         from qgis.core import QgsPointXY
 
@@ -440,11 +417,10 @@ class TestFeatureFinderQGIS:
         mock_canvas.mapSettings.return_value = mock_canvas_settings
 
         with patch.object(qgis_iface, "mapCanvas", return_value=mock_canvas):
-            with patch("dip_strike_tools.core.feature_finder.QgsProject"):
-                # Test with different tolerance values
-                test_point = QgsPointXY(100, 200)
-
-                # Should not crash with different tolerance values
-                finder.find_feature_at_point(test_point, tolerance_pixels=5)
-                finder.find_feature_at_point(test_point, tolerance_pixels=15)
-                finder.find_feature_at_point(test_point, tolerance_pixels=20)
+            # Test with different tolerance values
+            test_point = QgsPointXY(100, 200)
+
+            # Should not crash with different tolerance values
+            finder.find_feature_at_point(test_point, tolerance_pixels=5)
+            finder.find_feature_at_point(test_point, tolerance_pixels=15)
+            finder.find_feature_at_point(test_point, tolerance_pixels=20)
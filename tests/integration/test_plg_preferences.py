@@ -24,16 +24,12 @@ Usage from the repo root folder:
 .. code-block:: bash
 
     # for whole tests
-    python -m unittest tests.qgis.test_plg_preferences
+    python -m pytest tests/integration/test_plg_preferences.py
     # for specific test
-    python -m unittest tests.qgis.test_plg_preferences.TestPlgPreferences.test_plg_preferences_structure
+    python -m pytest tests/integration/test_plg_preferences.py::test_plg_preferences_structure
 """
 
-# standard library
-import os
-from unittest.mock import patch
-
-from qgis.testing import unittest
+import pytest
 
 # project
 from dip_strike_tools.__about__ import __version__
@@ -44,62 +40,55 @@ from dip_strike_tools.toolbelt.preferences import (
 )
 
 # ############################################################################
-# ########## Classes #############
+# ########## Fixtures ############
 # ################################
 
 
-class TestPlgPreferences(unittest.TestCase):
-    def test_plg_preferences_structure(self):
-        """Test settings types and default values."""
-        settings = PlgSettingsStructure()
-
-        # global
-        self.assertTrue(hasattr(settings, "debug_mode"))
-        self.assertIsInstance(settings.debug_mode, bool)
-        self.assertEqual(settings.debug_mode, False)
+@pytest.fixture(scope="module")
+def options_manager():
+    """Options manager shared by the module tests, which only read settings."""
+    return PlgOptionsManager()
 
-        self.assertTrue(hasattr(settings, "version"))
-        self.assertIsInstance(settings.version, str)
-        self.assertEqual(settings.version, __version__)
 
-    def test_bool_env_variable(self):
-        """Test settings with environment value."""
-        manager = PlgOptionsManager()
-        with patch.dict(os.environ, {f"{PREFIX_ENV_VARIABLE}DEBUG_MODE": "true"}, clear=True):
-            settings = manager.get_plg_settings()
-            self.assertEqual(settings.debug_mode, True)
+@pytest.fixture(scope="module")
+def default_settings():
+    """Default settings structure shared by the module tests."""
+    return PlgSettingsStructure()
 
-        with patch.dict(os.environ, {f"{PREFIX_ENV_VARIABLE}DEBUG_MODE": "false"}, clear=True):
-            settings = manager.get_plg_settings()
-            self.assertEqual(settings.debug_mode, False)
 
-        with patch.dict(os.environ, {f"{PREFIX_ENV_VARIABLE}DEBUG_MODE": "on"}, clear=True):
-            settings = manager.get_plg_settings()
-            self.assertEqual(settings.debug_mode, True)
+# ############################################################################
+# ########## Tests ###############
+# ################################
 
-        with patch.dict(os.environ, {f"{PREFIX_ENV_VARIABLE}DEBUG_MODE": "off"}, clear=True):
-            settings = manager.get_plg_settings()
-            self.assertEqual(settings.debug_mode, False)
 
-        with patch.dict(os.environ, {f"{PREFIX_ENV_VARIABLE}DEBUG_MODE": "1"}, clear=True):
-            settings = manager.get_plg_settings()
-            self.assertEqual(settings.debug_mode, True)
+def test_plg_preferences_structure(default_settings):
+    """Test settings types and default values."""
+    settings = default_settings
 
-        with patch.dict(os.environ, {f"{PREFIX_ENV_VARIABLE}DEBUG_MODE": "0"}, clear=True):
-            settings = manager.get_plg_settings()
-            self.assertEqual(settings.debug_mode, False)
+    # global
+    assert hasattr(settings, "debug_mode")
+    assert isinstance(settings.debug_mode, bool)
+    assert settings.debug_mode is False
 
-        with patch.dict(
-            os.environ,
-            {f"{PREFIX_ENV_VARIABLE}DEBUG_MODE": "invalid_value"},
-            clear=True,
-        ):
-            settings = manager.get_plg_settings()
-            self.assertEqual(settings.debug_mode, False)
+    assert hasattr(settings, "version")
+    assert isinstance(settings.version, str)
+    assert settings.version == __version__
 
 
-# ############################################################################
-# ####### Stand-alone run ########
-# ################################
-if __name__ == "__main__":
-    unittest.main()
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("true", True),
+        ("false", False),
+        ("on", True),
+        ("off", False),
+        ("1", True),
+        ("0", False),
+        ("invalid_value", False),
+    ],
+)
+def test_bool_env_variable(options_manager, monkeypatch, raw, expected):
+    """Test settings with environment value."""
+    monkeypatch.setenv(f"{PREFIX_ENV_VARIABLE}DEBUG_MODE", raw)
+    settings = options_manager.get_plg_settings()
+    assert settings.debug_mode == expected
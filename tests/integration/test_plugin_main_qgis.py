@@ -24,45 +24,128 @@ QGIS integration tests for plugin_main module.
 These tests require a QGIS environment and use pytest-qgis.
 """
 
-from unittest.mock import Mock, patch
+import functools
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
+
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from qgis.core import QgsApplication, QgsPointXY  # noqa: E402
+from qgis.gui import QgsMapCanvas  # noqa: E402
+from qgis.PyQt.QtWidgets import QAction  # noqa: E402
+
+from dip_strike_tools.core.dip_strike_map_tool import DipStrikeMapTool  # noqa: E402
 
 # Import pytest-qgis utilities
 pytest_plugins = ["pytest_qgis"]
 
+pytestmark = pytest.mark.qgis
+
+# Point clicked on the canvas by the insert dialog tests, never mutated
+TEST_POINT = QgsPointXY(100, 200)
+
+
+@functools.cache
+def _help_icon():
+    """Return the QGIS help theme icon, loaded once on first use (needs the QGIS application)."""
+    return QgsApplication.getThemeIcon("mActionHelp.svg")
+
+
+@pytest.fixture
+def insert_dialog_mock(mocker):
+    """Return a factory patching the insert dialog used by the plugin.
+
+    The factory takes the value returned by the dialog ``result()`` (1 for accepted, 0 for rejected)
+    and returns the patched dialog class.
+    """
+
+    def _make(result=1):
+        mock_dialog = mocker.patch("dip_strike_tools.plugin_main.DlgInsertDipStrike")
+        mock_dialog.Accepted = 1
+        mock_dialog.return_value.result.return_value = result
+        return mock_dialog
+
+    return _make
+
+
+@pytest.fixture
+def create_layer_mocks(mocker):
+    """Patch the create layer dialog, the layer creator and the project used by the plugin.
+
+    The dialog is accepted and returns a memory layer config without symbology.
+    """
+    mocks = mocker.patch.multiple(
+        "dip_strike_tools.plugin_main", DlgCreateLayer=DEFAULT, DipStrikeLayerCreator=DEFAULT, QgsProject=DEFAULT
+    )
+    mock_dialog = mocks["DlgCreateLayer"]
+    mock_creator = mocks["DipStrikeLayerCreator"]
+    mock_project = mocks["QgsProject"]
+
+    # Mock dialog
+    layer_config = {"name": "Test Layer", "crs": Mock(), "symbology": {"apply": False}}
+    mock_dlg_instance = Mock()
+    mock_dlg_instance.result.return_value = 1  # QDialog.Accepted
+    mock_dlg_instance.get_layer_config.return_value = layer_config
+    mock_dialog.return_value = mock_dlg_instance
+    mock_dialog.Accepted = 1
+
+    # Mock layer creator
+    mock_layer = Mock()
+    mock_layer.name.return_value = "Test Layer"
+    mock_creator_instance = Mock()
+    mock_creator_instance.create_dip_strike_layer.return_value = mock_layer
+    mock_creator.return_value = mock_creator_instance
+
+    # Mock project
+    mock_project_instance = Mock()
+    mock_project.instance.return_value = mock_project_instance
+
+    return SimpleNamespace(
+        dialog=mock_dialog,
+        dlg_instance=mock_dlg_instance,
+        layer_config=layer_config,
+        creator=mock_creator,
+        creator_instance=mock_creator_instance,
+        layer=mock_layer,
+        project_instance=mock_project_instance,
+    )
+
 
 class TestDipStrikeToolsPluginQGIS:
     """QGIS integration tests for DipStrikeToolsPlugin."""
 
-    def test_plugin_initialization_with_qgis(self, qgis_iface):
+    def test_plugin_initialization_with_qgis(self, qgis_iface, fresh_plugin):
         """Test plugin initialization with real QGIS interface."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        # Initialize plugin with QGIS interface
-        plugin = DipStrikeToolsPlugin(qgis_iface)
+        plugin = fresh_plugin
 
         # Verify basic attributes
         assert plugin.iface == qgis_iface
         assert hasattr(plugin, "log")
-        assert hasattr(plugin, "toolbar")
+
+        # The toolbar is only guaranteed once the GUI has been initialized
+        try:
+            plugin.initGui()
+        except AttributeError as e:
+            # The pytest-qgis interface stub doesn't implement every QgisInterface method used by initGui
+            pytest.skip(f"QGIS interface stub lacks a method used by initGui: {e}")
 
         # Verify toolbar was created
-        assert plugin.toolbar is not None
-        assert plugin.toolbar.objectName() == "DipStrikeToolsToolbar"
+        tb = plugin.toolbar
+        assert tb is not None
+        assert tb.objectName() == "DipStrikeToolsToolbar"
 
-    def test_add_action_method(self, qgis_iface):
+    def test_add_action_method(self, fresh_plugin):
         """Test the add_action method."""
-        from qgis.core import QgsApplication
-
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
+        plugin = fresh_plugin
 
         # Mock callback
         mock_callback = Mock()
 
         # Add an action
         action = plugin.add_action(
-            icon_path=QgsApplication.getThemeIcon("mActionHelp.svg"),
+            icon_path=_help_icon(),
             text="Test Action",
             callback=mock_callback,
             enabled_flag=True,
@@ -78,22 +161,18 @@ class TestDipStrikeToolsPluginQGIS:
         toolbar_actions = plugin.toolbar.actions()
         assert action in toolbar_actions
 
-    def test_translation_method(self, qgis_iface):
+    def test_translation_method(self, shared_plugin):
         """Test the translation method."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
+        plugin = shared_plugin
 
         # Test translation of a simple string
         translated = plugin.tr("Test string")
         assert isinstance(translated, str)
         assert len(translated) > 0
 
-    def test_initGui_method(self, qgis_iface):
+    def test_initGui_method(self, fresh_plugin):
         """Test the initGui method doesn't crash."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
+        plugin = fresh_plugin
 
         # This should not raise an exception
         try:
@@ -116,11 +195,9 @@ class TestDipStrikeToolsPluginQGIS:
             assert hasattr(plugin, "create_layer_action")
             assert hasattr(plugin, "settings_action")
 
-    def test_unload_method(self, qgis_iface):
+    def test_unload_method(self, fresh_plugin):
         """Test the unload method doesn't crash."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
+        plugin = fresh_plugin
 
         # Initialize first (may fail but that's OK)
         try:
@@ -145,202 +222,57 @@ class TestDipStrikeToolsPluginQGIS:
             for missing in ["not exist", "no attribute", "removepluginmenu", "removePluginMenu"]
         )
 
-    @patch("dip_strike_tools.plugin_main.DlgCreateLayer")
-    @patch("dip_strike_tools.plugin_main.DipStrikeLayerCreator")
-    @patch("dip_strike_tools.plugin_main.QgsProject")
-    def test_open_create_layer_dialog_method(self, mock_project, mock_creator, mock_dialog, qgis_iface):
-        """Test the open_create_layer_dialog method."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
-
-        # Mock dialog behavior
-        mock_dlg_instance = Mock()
-        mock_dlg_instance.result.return_value = 1  # QDialog.Accepted
-        mock_dlg_instance.get_layer_config.return_value = {
-            "name": "Test Layer",
-            "format": "Memory Layer",
-            "crs": Mock(),
-            "symbology": {"apply": False},
-        }
-        mock_dialog.return_value = mock_dlg_instance
-        mock_dialog.Accepted = 1  # Standard QDialog accepted result
-
-        # Mock layer creator
-        mock_layer = Mock()
-        mock_layer.name.return_value = "Test Layer"
-        mock_creator_instance = Mock()
-        mock_creator_instance.create_dip_strike_layer.return_value = mock_layer
-        mock_creator.return_value = mock_creator_instance
+    @pytest.mark.parametrize(
+        "apply_symbology,symbology_result",
+        [(False, None), (True, True), (True, False)],
+        ids=["no_symbology", "symbology_success", "symbology_failure"],
+    )
+    def test_open_create_layer_dialog(self, shared_plugin, create_layer_mocks, apply_symbology, symbology_result):
+        """Test the create layer dialog workflow, with and without symbology."""
+        plugin = shared_plugin
 
-        # Mock project
-        mock_project_instance = Mock()
-        mock_project.instance.return_value = mock_project_instance
-
-        # Call the method
-        plugin.open_create_layer_dialog()
-
-        # Verify dialog was created and executed
-        mock_dialog.assert_called_once()
-        mock_dlg_instance.exec.assert_called_once()
-
-        # Verify the dialog result was checked
-        mock_dlg_instance.result.assert_called_once()
-
-        # If dialog was accepted, verify layer creation workflow
-        if mock_dlg_instance.result.return_value == 1:
-            mock_dlg_instance.get_layer_config.assert_called_once()
-            mock_creator.assert_called_once()
-            mock_creator_instance.create_dip_strike_layer.assert_called_once()
-            mock_project_instance.addMapLayer.assert_called_once_with(mock_layer)
-
-    @patch("dip_strike_tools.plugin_main.DlgCreateLayer")
-    @patch("dip_strike_tools.plugin_main.DipStrikeLayerCreator")
-    @patch("dip_strike_tools.plugin_main.QgsProject")
-    def test_open_create_layer_dialog_success_with_symbology(
-        self, mock_project, mock_creator, mock_dialog, qgis_iface
-    ):
-        """Test create layer dialog with successful layer creation and symbology."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
-
-        # Mock dialog
-        mock_dlg_instance = Mock()
-        mock_dlg_instance.result.return_value = 1  # QDialog.Accepted
-        mock_layer_config = {"name": "Test Layer", "crs": Mock(), "symbology": {"apply": True}}
-        mock_dlg_instance.get_layer_config.return_value = mock_layer_config
-        mock_dialog.return_value = mock_dlg_instance
-        mock_dialog.Accepted = 1
-
-        # Mock layer creator
-        mock_layer = Mock()
-        mock_layer.name.return_value = "Test Layer"
-        mock_creator_instance = Mock()
-        mock_creator_instance.create_dip_strike_layer.return_value = mock_layer
-        mock_creator_instance.apply_symbology.return_value = True
-        mock_creator.return_value = mock_creator_instance
-
-        # Mock project
-        mock_project_instance = Mock()
-        mock_project.instance.return_value = mock_project_instance
+        mocks = create_layer_mocks
+        mocks.layer_config["symbology"]["apply"] = apply_symbology
+        mocks.creator_instance.apply_symbology.return_value = symbology_result
 
         # Call the method
         plugin.open_create_layer_dialog()
 
         # Verify dialog workflow
-        mock_dialog.assert_called_once()
-        mock_dlg_instance.exec.assert_called_once()
-        mock_dlg_instance.get_layer_config.assert_called_once()
+        mocks.dialog.assert_called_once()
+        mocks.dlg_instance.exec.assert_called_once()
+        mocks.dlg_instance.result.assert_called_once()
+        mocks.dlg_instance.get_layer_config.assert_called_once()
 
         # Verify layer creation workflow
-        mock_creator.assert_called_once()
-        mock_creator_instance.create_dip_strike_layer.assert_called_once_with(
-            mock_layer_config, mock_layer_config["crs"]
+        mocks.creator.assert_called_once()
+        mocks.creator_instance.create_dip_strike_layer.assert_called_once_with(
+            mocks.layer_config, mocks.layer_config["crs"]
         )
-        mock_project_instance.addMapLayer.assert_called_once_with(mock_layer)
-        mock_creator_instance.apply_symbology.assert_called_once_with(mock_layer)
-
-    @patch("dip_strike_tools.plugin_main.DlgCreateLayer")
-    @patch("dip_strike_tools.plugin_main.DipStrikeLayerCreator")
-    @patch("dip_strike_tools.plugin_main.QgsProject")
-    def test_open_create_layer_dialog_success_no_symbology(self, mock_project, mock_creator, mock_dialog, qgis_iface):
-        """Test create layer dialog with successful layer creation but no symbology."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
-
-        # Mock dialog
-        mock_dlg_instance = Mock()
-        mock_dlg_instance.result.return_value = 1  # QDialog.Accepted
-        mock_layer_config = {"name": "Test Layer", "crs": Mock(), "symbology": {"apply": False}}
-        mock_dlg_instance.get_layer_config.return_value = mock_layer_config
-        mock_dialog.return_value = mock_dlg_instance
-        mock_dialog.Accepted = 1
-
-        # Mock layer creator
-        mock_layer = Mock()
-        mock_layer.name.return_value = "Test Layer"
-        mock_creator_instance = Mock()
-        mock_creator_instance.create_dip_strike_layer.return_value = mock_layer
-        mock_creator.return_value = mock_creator_instance
-
-        # Mock project
-        mock_project_instance = Mock()
-        mock_project.instance.return_value = mock_project_instance
+        mocks.project_instance.addMapLayer.assert_called_once_with(mocks.layer)
 
-        # Call the method
-        plugin.open_create_layer_dialog()
+        # Symbology is only attempted when requested, whatever its outcome
+        if apply_symbology:
+            mocks.creator_instance.apply_symbology.assert_called_once_with(mocks.layer)
+        else:
+            mocks.creator_instance.apply_symbology.assert_not_called()
 
-        # Verify layer creation workflow but no symbology
-        mock_creator_instance.create_dip_strike_layer.assert_called_once()
-        mock_project_instance.addMapLayer.assert_called_once_with(mock_layer)
-        # Symbology should not be called since apply=False
-        mock_creator_instance.apply_symbology.assert_not_called()
-
-    @patch("dip_strike_tools.plugin_main.DlgCreateLayer")
-    @patch("dip_strike_tools.plugin_main.DipStrikeLayerCreator")
-    @patch("dip_strike_tools.plugin_main.QgsProject")
-    def test_open_create_layer_dialog_symbology_failure(self, mock_project, mock_creator, mock_dialog, qgis_iface):
-        """Test create layer dialog when symbology application fails."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
-
-        # Mock dialog
-        mock_dlg_instance = Mock()
-        mock_dlg_instance.result.return_value = 1  # QDialog.Accepted
-        mock_layer_config = {"name": "Test Layer", "crs": Mock(), "symbology": {"apply": True}}
-        mock_dlg_instance.get_layer_config.return_value = mock_layer_config
-        mock_dialog.return_value = mock_dlg_instance
-        mock_dialog.Accepted = 1
-
-        # Mock layer creator with symbology failure
-        mock_layer = Mock()
-        mock_layer.name.return_value = "Test Layer"
-        mock_creator_instance = Mock()
-        mock_creator_instance.create_dip_strike_layer.return_value = mock_layer
-        mock_creator_instance.apply_symbology.return_value = False  # Failure
-        mock_creator.return_value = mock_creator_instance
-
-        # Mock project
-        mock_project_instance = Mock()
-        mock_project.instance.return_value = mock_project_instance
-
-        # Call the method
-        plugin.open_create_layer_dialog()
-
-        # Verify symbology was attempted but failed
-        mock_creator_instance.apply_symbology.assert_called_once_with(mock_layer)
-
-    def test_dialog_methods_callable(self, qgis_iface):
+    def test_dialog_methods_callable(self, shared_plugin):
         """Test that dialog methods are callable without crashing."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
+        plugin = shared_plugin
 
         # These methods should exist and be callable
         assert callable(plugin.open_dlg_insert_dip_strike)
         assert callable(plugin.open_create_layer_dialog)
 
-    @patch("dip_strike_tools.plugin_main.DlgInsertDipStrike")
-    def test_open_dlg_insert_dip_strike_no_existing_feature(self, mock_dialog, qgis_iface):
+    def test_open_dlg_insert_dip_strike_no_existing_feature(self, insert_dialog_mock, qgis_iface, shared_plugin):
         """Test opening insert dialog without existing feature."""
-        from qgis.core import QgsPointXY
+        plugin = shared_plugin
 
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
-
-        # Mock dialog
-        mock_dlg_instance = Mock()
-        mock_dlg_instance.result.return_value = 1  # QDialog.Accepted
-        mock_dialog.return_value = mock_dlg_instance
-        mock_dialog.Accepted = 1
+        mock_dialog = insert_dialog_mock(1)  # QDialog.Accepted
 
         # Test with clicked point but no existing feature
-        test_point = QgsPointXY(100, 200)
-        plugin.open_dlg_insert_dip_strike(clicked_point=test_point)
+        plugin.open_dlg_insert_dip_strike(clicked_point=TEST_POINT)
 
         # Verify dialog was created with correct parameters
         mock_dialog.assert_called_once()
@@ -348,28 +280,18 @@ class TestDipStrikeToolsPluginQGIS:
         assert qgis_iface.mainWindow() in call_args[0]  # parent
         # Check keyword arguments
         kwargs = call_args[1]
-        assert kwargs["clicked_point"] == test_point
+        assert kwargs["clicked_point"] == TEST_POINT
         assert kwargs["existing_feature"] is None
 
-        mock_dlg_instance.exec.assert_called_once()
+        mock_dialog.return_value.exec.assert_called_once()
 
-    @patch("dip_strike_tools.plugin_main.DlgInsertDipStrike")
-    def test_open_dlg_insert_dip_strike_with_existing_feature(self, mock_dialog, qgis_iface):
+    def test_open_dlg_insert_dip_strike_with_existing_feature(self, insert_dialog_mock, shared_plugin):
         """Test opening insert dialog with existing feature."""
-        from qgis.core import QgsPointXY
+        plugin = shared_plugin
 
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
-
-        # Mock dialog
-        mock_dlg_instance = Mock()
-        mock_dlg_instance.result.return_value = 0  # QDialog.Rejected
-        mock_dialog.return_value = mock_dlg_instance
-        mock_dialog.Accepted = 1
+        mock_dialog = insert_dialog_mock(0)  # QDialog.Rejected
 
         # Test with existing feature provided
-        test_point = QgsPointXY(100, 200)
         mock_feature = Mock()
         mock_feature.id.return_value = 123
         existing_feature = {
@@ -378,71 +300,49 @@ class TestDipStrikeToolsPluginQGIS:
             "is_configured": True,
         }
 
-        plugin.open_dlg_insert_dip_strike(clicked_point=test_point, existing_feature=existing_feature)
+        plugin.open_dlg_insert_dip_strike(clicked_point=TEST_POINT, existing_feature=existing_feature)
 
         # Verify dialog was created with existing feature
         mock_dialog.assert_called_once()
         call_args = mock_dialog.call_args
         kwargs = call_args[1]
-        assert kwargs["clicked_point"] == test_point
+        assert kwargs["clicked_point"] == TEST_POINT
         assert kwargs["existing_feature"] == existing_feature
 
-    def test_toggle_dip_strike_tool_activation(self, qgis_iface):
-        """Test toggling the dip strike tool on."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
-
-        # Mock the action
-        plugin.insert_dip_strike_action = Mock()
-        plugin.insert_dip_strike_action.isChecked.return_value = True
-
-        # Mock activate method
-        plugin.activate_dip_strike_tool = Mock()
-
-        # Test toggle when checked
-        plugin.toggle_dip_strike_tool()
-
-        plugin.activate_dip_strike_tool.assert_called_once()
-
-    def test_toggle_dip_strike_tool_deactivation(self, qgis_iface):
-        """Test toggling the dip strike tool off."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
+    @pytest.mark.parametrize(
+        "checked,method",
+        [(True, "activate_dip_strike_tool"), (False, "deactivate_dip_strike_tool")],
+        ids=["activation", "deactivation"],
+    )
+    def test_toggle_dip_strike_tool(self, shared_plugin, monkeypatch, checked, method):
+        """Test toggling the dip strike tool on and off."""
+        plugin = shared_plugin
 
         # Mock the action
-        plugin.insert_dip_strike_action = Mock()
-        plugin.insert_dip_strike_action.isChecked.return_value = False
+        monkeypatch.setattr(plugin, "insert_dip_strike_action", Mock(), raising=False)
+        plugin.insert_dip_strike_action.isChecked.return_value = checked
 
-        # Mock deactivate method
-        plugin.deactivate_dip_strike_tool = Mock()
+        # Mock the method expected to handle the toggle
+        monkeypatch.setattr(plugin, method, Mock())
 
-        # Test toggle when unchecked
         plugin.toggle_dip_strike_tool()
 
-        plugin.deactivate_dip_strike_tool.assert_called_once()
+        getattr(plugin, method).assert_called_once()
 
-    @patch("dip_strike_tools.plugin_main.DipStrikeMapTool")
-    def test_activate_dip_strike_tool(self, mock_map_tool, qgis_iface):
+    def test_activate_dip_strike_tool(self, qgis_iface, fresh_plugin, mocker):
         """Test activating the dip strike tool."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
+        plugin = fresh_plugin
+        mock_map_tool = mocker.patch("dip_strike_tools.plugin_main.DipStrikeMapTool")
 
         # Mock action
-        plugin.insert_dip_strike_action = Mock()
+        plugin.insert_dip_strike_action = Mock(spec=QAction)
 
-        # Mock tool instance that looks like a proper map tool
-        mock_tool_instance = Mock()
-        mock_tool_instance.setPlugin = Mock()
-        mock_tool_instance.featureClicked = Mock()
-        mock_tool_instance.featureClicked.connect = Mock()
+        # Mock tool instance restricted to the map tool interface
+        mock_tool_instance = Mock(spec=DipStrikeMapTool)
         mock_map_tool.return_value = mock_tool_instance
 
-        # Mock the mapCanvas setMapTool to accept our mock tool
-        mock_canvas = Mock()
-        mock_canvas.setMapTool = Mock()
+        # Mock the map canvas so setMapTool accepts our mock tool
+        mock_canvas = Mock(spec=QgsMapCanvas)
 
         # Use patch.object to mock the mapCanvas method
         with patch.object(qgis_iface, "mapCanvas", return_value=mock_canvas):
@@ -455,18 +355,16 @@ class TestDipStrikeToolsPluginQGIS:
             mock_canvas.setMapTool.assert_called_once_with(mock_tool_instance)
             plugin.insert_dip_strike_action.setChecked.assert_called_once_with(True)
 
-    def test_deactivate_dip_strike_tool(self, qgis_iface):
+    def test_deactivate_dip_strike_tool(self, qgis_iface, shared_plugin, monkeypatch):
         """Test deactivating the dip strike tool."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
+        plugin = shared_plugin
 
         # Mock action
-        plugin.insert_dip_strike_action = Mock()
+        monkeypatch.setattr(plugin, "insert_dip_strike_action", Mock(), raising=False)
 
         # Create a mock tool and set it as current
         mock_tool = Mock()
-        plugin.custom_tool = mock_tool
+        monkeypatch.setattr(plugin, "custom_tool", mock_tool, raising=False)
 
         # Mock the map canvas to return our tool as current
         with patch.object(qgis_iface.mapCanvas(), "mapTool", return_value=mock_tool):
@@ -478,111 +376,49 @@ class TestDipStrikeToolsPluginQGIS:
                 mock_unset.assert_called_once_with(mock_tool)
                 plugin.insert_dip_strike_action.setChecked.assert_called_once_with(False)
 
-    def test_on_map_tool_changed_our_tool_active(self, qgis_iface):
-        """Test map tool change handler when our tool becomes active."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
+    @pytest.mark.parametrize("our_tool_active", [True, False], ids=["our_tool_active", "other_tool_active"])
+    def test_on_map_tool_changed(self, shared_plugin, monkeypatch, our_tool_active):
+        """Test that the map tool change handler checks the action only when our tool becomes active."""
+        plugin = shared_plugin
 
-        plugin = DipStrikeToolsPlugin(qgis_iface)
-
-        # Mock action
-        plugin.insert_dip_strike_action = Mock()
-        plugin.insert_dip_strike_action.isChecked.return_value = False
+        # Mock action, initially in the opposite state
+        monkeypatch.setattr(plugin, "insert_dip_strike_action", Mock(), raising=False)
+        plugin.insert_dip_strike_action.isChecked.return_value = not our_tool_active
 
         # Mock our tool
         mock_tool = Mock()
-        plugin.custom_tool = mock_tool
-
-        # Test when our tool becomes active
-        plugin.on_map_tool_changed(mock_tool)
-
-        plugin.insert_dip_strike_action.setChecked.assert_called_once_with(True)
-
-    def test_on_map_tool_changed_other_tool_active(self, qgis_iface):
-        """Test map tool change handler when another tool becomes active."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
-
-        # Mock action
-        plugin.insert_dip_strike_action = Mock()
-        plugin.insert_dip_strike_action.isChecked.return_value = True
-
-        # Mock our tool
-        mock_tool = Mock()
-        plugin.custom_tool = mock_tool
-
-        # Mock other tool
-        other_tool = Mock()
+        monkeypatch.setattr(plugin, "custom_tool", mock_tool, raising=False)
 
-        # Test when other tool becomes active
-        plugin.on_map_tool_changed(other_tool)
+        plugin.on_map_tool_changed(mock_tool if our_tool_active else Mock())
 
-        plugin.insert_dip_strike_action.setChecked.assert_called_once_with(False)
+        plugin.insert_dip_strike_action.setChecked.assert_called_once_with(our_tool_active)
 
-    def test_unload_method_exception_handling(self, qgis_iface):
+    def test_unload_method_exception_handling(self, configured_iface, unload_ready_plugin):
         """Test unload method when signal disconnection fails."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
-
-        # Add missing methods to the qgis_iface mock
-        qgis_iface.unregisterOptionsWidgetFactory = Mock()
-        qgis_iface.removePluginMenu = Mock()
-        qgis_iface.removePluginDatabaseMenu = Mock()
-        qgis_iface.removeToolBarIcon = Mock()
-        qgis_iface.pluginHelpMenu = Mock()
-        mock_help_menu = Mock()
-        mock_help_menu.removeAction = Mock()
-        qgis_iface.pluginHelpMenu.return_value = mock_help_menu
-
-        # Set up objects for cleanup
-        plugin.options_factory = Mock()
-        plugin.action_help_plugin_menu_documentation = Mock()
+        plugin = unload_ready_plugin
 
         # Mock the map canvas with disconnect failure
         mock_canvas = Mock()
-        mock_canvas.mapToolSet = Mock()
         mock_canvas.mapToolSet.disconnect.side_effect = Exception("Disconnect failed")
 
-        with patch.object(qgis_iface, "mapCanvas", return_value=mock_canvas):
+        with patch.object(configured_iface, "mapCanvas", return_value=mock_canvas):
             # Call unload - should handle the exception gracefully
             plugin.unload()
 
-            # Verify the method completed despite the exception
-            qgis_iface.unregisterOptionsWidgetFactory.assert_called_with(plugin.options_factory)
+        # Verify the method completed despite the exception
+        configured_iface.unregisterOptionsWidgetFactory.assert_called_with(plugin.options_factory)
 
-    def test_unload_method_no_custom_tool(self, qgis_iface):
+    def test_unload_method_no_custom_tool(self, configured_iface, unload_ready_plugin):
         """Test unload method when no custom tool exists."""
-        from dip_strike_tools.plugin_main import DipStrikeToolsPlugin
-
-        plugin = DipStrikeToolsPlugin(qgis_iface)
-
-        # Add missing methods to the qgis_iface mock
-        qgis_iface.unregisterOptionsWidgetFactory = Mock()
-        qgis_iface.removePluginMenu = Mock()
-        qgis_iface.removePluginDatabaseMenu = Mock()
-        qgis_iface.removeToolBarIcon = Mock()
-        qgis_iface.pluginHelpMenu = Mock()
-        mock_help_menu = Mock()
-        mock_help_menu.removeAction = Mock()
-        qgis_iface.pluginHelpMenu.return_value = mock_help_menu
-
-        # Set up objects for cleanup
-        plugin.options_factory = Mock()
-        plugin.action_help_plugin_menu_documentation = Mock()
+        plugin = unload_ready_plugin
 
         # Ensure no custom tool exists
         if hasattr(plugin, "custom_tool"):
             delattr(plugin, "custom_tool")
 
-        # Mock the map canvas
-        mock_canvas = Mock()
-        mock_canvas.mapToolSet = Mock()
-        mock_canvas.mapToolSet.disconnect = Mock()
-
-        with patch.object(qgis_iface, "mapCanvas", return_value=mock_canvas):
+        with patch.object(configured_iface, "mapCanvas", return_value=Mock()):
             # Call unload - should handle the missing custom tool gracefully
             plugin.unload()
 
-            # Verify cleanup continued
-            qgis_iface.unregisterOptionsWidgetFactory.assert_called_with(plugin.options_factory)
+        # Verify cleanup continued
+        configured_iface.unregisterOptionsWidgetFactory.assert_called_with(plugin.options_factory)
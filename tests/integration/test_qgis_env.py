@@ -26,32 +26,10 @@ def test_qgis_environment():
     data providers initialized by QgsApplication.initQgis()
     """
     # QgsApplication.setPrefixPath("/usr", True)
-    print(f"\n\n{'*' * 80}")
-    print("If this is failing, the QGIS Prefix Path might not be set correctly.")
-    print("QGIS Prefix Path:", QgsApplication.prefixPath())
-    print("Set QGIS_PREFIX_PATH environment variable with the correct QGIS install path.")
-    print(f"{'*' * 80}\n\n")
-    r = QgsProviderRegistry.instance()
-    assert "spatialite" in r.providerList()  # this is absolutely required
-    assert "ogr" in r.providerList()
-    assert "gdal" in r.providerList()
-    assert "postgres" in r.providerList()
-
-
-# def test_qgis_environment_alt():
-#     """
-#     Test that the full QGIS environment is set up correctly (without pytest-qgis)
-#     If this is the case, we should have access to some common
-#     data providers initialized by QgsApplication.initQgis()
-#     """
-#     QgsApplication.setPrefixPath("/usr", True)
-#     from qgis.testing import start_app
-#     start_app()
-
-#     from qgis.core import QgsProviderRegistry
-
-#     r = QgsProviderRegistry.instance()
-#     assert "spatialite" in r.providerList()
-#     assert "ogr" in r.providerList()
-#     assert "gdal" in r.providerList()
-#     assert "postgres" in r.providerList()
+    providers = set(QgsProviderRegistry.instance().providerList())
+    # spatialite is absolutely required
+    missing = {"spatialite", "ogr", "gdal", "postgres"} - providers
+    assert not missing, (
+        f"Providers {sorted(missing)} not found, the QGIS Prefix Path ({QgsApplication.prefixPath()!r}) might not be "
+        "set correctly. Set QGIS_PREFIX_PATH environment variable with the correct QGIS install path."
+    )
@@ -140,6 +140,41 @@ class TestDipStrikeCalculator(unittest.TestCase):
         expected = round((test_value + 90) % 360, 2)
         self.assertEqual(result, expected)
 
+    def test_calculate_values_matches_scalar_methods(self):
+        """Test that the batch calculation gives the same results as the scalar methods."""
+        test_values = [0, 45.123456789, 90, "135", 180.5, 270, 315, 359.996]
+
+        self.assertEqual(
+            self.calculator._calculate_values(test_values, "dip_from_strike", 3),
+            [self.calculator.calculate_dip_from_strike(value, 3) for value in test_values],
+        )
+        self.assertEqual(
+            self.calculator._calculate_values(test_values, "strike_from_dip", 3),
+            [self.calculator.calculate_strike_from_dip(value, 3) for value in test_values],
+        )
+
+    def test_calculate_values_same_results_with_and_without_numpy(self):
+        """Test that the NumPy and the scalar fallback paths give the same results on boundary inputs."""
+        from unittest.mock import patch
+
+        # Outputs ending in 5 right after the last kept decimal, where float representation matters,
+        # and non-finite inputs, which both paths report as None
+        test_values = [1.005, 2.675, 44.995, 134.125, 224.0005, 359.995, -0.005, float("inf"), "-inf", "nan"]
+
+        for calculation_type in ("dip_from_strike", "strike_from_dip"):
+            for decimal_places in (2, 3):
+                with_numpy = self.calculator._calculate_values(test_values, calculation_type, decimal_places)
+                with patch("dip_strike_tools.core.dip_strike_calculator.np", None):
+                    without_numpy = self.calculator._calculate_values(test_values, calculation_type, decimal_places)
+                self.assertEqual(with_numpy, without_numpy)
+
+    def test_calculate_values_invalid_inputs(self):
+        """Test that invalid values in a batch give None without affecting the valid ones."""
+        result = self.calculator._calculate_values([0, "invalid", None, float("inf"), "nan", 90], "dip_from_strike")
+        self.assertEqual(result, [90.0, None, None, None, None, 180.0])
+
+        self.assertEqual(self.calculator._calculate_values([], "strike_from_dip"), [])
+
     def test_initialization(self):
         """Test calculator initialization."""
         calculator = DipStrikeCalculator()
@@ -389,9 +424,9 @@ class TestDipStrikeCalculator(unittest.TestCase):
             # Mock feature with valid data
             mock_feature = Mock()
             mock_feature.attribute.return_value = 45.0  # Valid input value
-            mock_feature.setAttributes.return_value = True
             mock_layer.getFeatures.return_value = [mock_feature]
-            mock_layer.updateFeature.return_value = True
+
+            mock_layer.changeAttributeValues.return_value = True
 
             mock_input_field = Mock()
             mock_input_field.name.return_value = "input_field"
@@ -408,6 +443,7 @@ class TestDipStrikeCalculator(unittest.TestCase):
                 success, message = self.calculator.process_layer(config)
                 self.assertTrue(success)
                 self.assertIn("Successfully calculated 1 values", message)
+                mock_layer.changeAttributeValues.assert_called_once_with(mock_feature.id.return_value, {0: 135.0})
 
     def test_process_layer_with_strike_calculation(self):
         """Test process_layer with strike calculation type."""
@@ -426,9 +462,9 @@ class TestDipStrikeCalculator(unittest.TestCase):
             # Mock feature with valid data
             mock_feature = Mock()
             mock_feature.attribute.return_value = 135.0  # Valid dip value
-            mock_feature.setAttributes.return_value = True
             mock_layer.getFeatures.return_value = [mock_feature]
-            mock_layer.updateFeature.return_value = True
+
+            mock_layer.changeAttributeValues.return_value = True
 
             mock_input_field = Mock()
             mock_input_field.name.return_value = "dip_field"
@@ -445,3 +481,45 @@ class TestDipStrikeCalculator(unittest.TestCase):
                 success, message = self.calculator.process_layer(config)
                 self.assertTrue(success)
                 self.assertIn("Successfully calculated 1 values", message)
+
+    def test_process_layer_writes_through_edit_buffer(self):
+        """Test process_layer writes all the values through the layer edit buffer."""
+        from unittest.mock import Mock, call, patch
+
+        with patch("dip_strike_tools.core.dip_strike_calculator.isinstance") as mock_isinstance:
+            mock_isinstance.return_value = True
+
+            mock_layer = Mock()
+            mock_layer.isValid.return_value = True
+            mock_layer.addAttribute.return_value = True
+            mock_fields = Mock()
+            mock_fields.indexFromName.side_effect = [0, 0]  # Both fields exist
+            mock_layer.fields.return_value = mock_fields
+            mock_layer.changeAttributeValues.return_value = True
+
+            # Two features with valid data
+            mock_features = [Mock(), Mock()]
+            for fid, mock_feature in enumerate(mock_features):
+                mock_feature.id.return_value = fid
+                mock_feature.attribute.return_value = 45.0
+            mock_layer.getFeatures.return_value = mock_features
+
+            mock_input_field = Mock()
+            mock_input_field.name.return_value = "input_field"
+
+            config = {
+                "layer": mock_layer,
+                "calculation_type": "dip_from_strike",
+                "input_field": mock_input_field,
+                "create_new_field": True,
+                "new_field_name": "test_field",
+            }
+
+            with patch("dip_strike_tools.core.dip_strike_calculator.edit"):
+                success, message = self.calculator.process_layer(config)
+                self.assertTrue(success)
+                self.assertIn("Successfully calculated 2 values", message)
+                mock_layer.dataProvider.assert_not_called()
+                self.assertEqual(
+                    mock_layer.changeAttributeValues.call_args_list, [call(0, {0: 135.0}), call(1, {0: 135.0})]
+                )
@@ -26,6 +26,38 @@ import pytest
 
 from dip_strike_tools.core import dip_strike_math
 
+# (input_value, expected_output, description) cases for format_bearing
+_BEARING_CASES = [
+    (0.0, "0.00°", "positive zero"),
+    (-0.0, "0.00°", "negative zero should become positive"),
+    (-0.001, "0.00°", "very small negative value"),
+    (0.001, "0.00°", "very small positive value"),
+    (-0.003, "0.00°", "small negative label value"),
+    (-0.004, "0.00°", "small negative within threshold"),
+    (0.004, "0.00°", "small positive within threshold"),
+    (-0.005, "-0.01°", "negative value at threshold boundary"),
+    (0.005, "0.01°", "positive value at threshold boundary"),
+    (-0.01, "-0.01°", "small negative value outside threshold"),
+    (0.01, "0.01°", "small positive value outside threshold"),
+    (1.0, "1.00°", "normal positive value"),
+    (-1.0, "-1.00°", "normal negative value"),
+    (45.0, "45.00°", "normal compass value"),
+    (45.5, "45.50°", "fractional positive value"),
+    (-45.5, "-45.50°", "fractional negative value"),
+    (90.0, "90.00°", "right angle"),
+    (180.0, "180.00°", "half circle"),
+    (270.0, "270.00°", "three quarters"),
+    (359.99, "359.99°", "close to full circle"),
+    (360.0, "360.00°", "full circle"),
+    (-90.0, "-90.00°", "negative right angle"),
+    (-180.0, "-180.00°", "negative half circle"),
+    # Edge cases for floating point precision
+    (-0.0001, "0.00°", "very small negative"),
+    (0.0001, "0.00°", "very small positive"),
+    (-0.00001, "0.00°", "extremely small negative"),
+    (0.00001, "0.00°", "extremely small positive"),
+]
+
 
 @pytest.mark.unit
 class TestValidateAzimuthRange:
@@ -226,6 +258,30 @@ class TestGetStrikeAndDipFromAzimuth:
         assert dip == 10.0
 
 
+@pytest.mark.unit
+class TestFormatBearing:
+    """Test bearing formatting."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [case[:2] for case in _BEARING_CASES],
+        ids=[case[2] for case in _BEARING_CASES],
+    )
+    def test_format_bearing(self, value, expected):
+        """Test proper formatting and negative zero handling."""
+        assert dip_strike_math.format_bearing(value) == expected
+
+    @pytest.mark.parametrize("value", [float("inf"), float("-inf")], ids=["inf", "-inf"])
+    def test_non_finite(self, value):
+        """Test that infinity values are handled gracefully."""
+        assert isinstance(dip_strike_math.format_bearing(value), str)
+
+    def test_none_raises(self):
+        """Test that None is rejected."""
+        with pytest.raises(TypeError):
+            dip_strike_math.format_bearing(None)
+
+
 @pytest.mark.integration
 class TestIntegrationWithExistingLogic:
     """Test integration with existing calculation patterns."""
@@ -33,31 +33,6 @@ import pytest
 class TestDlgInsertDipStrikeUnit(unittest.TestCase):
     """Unit tests for DlgInsertDipStrike dialog methods."""
 
-    def test_format_bearing_comprehensive(self):
-        """Test comprehensive bearing formatting scenarios."""
-        from dip_strike_tools.core import dip_strike_math
-
-        # Test comprehensive bearing cases
-        test_cases = [
-            (-0.0, "0.00°"),
-            (-0.001, "0.00°"),
-            (-0.004, "0.00°"),
-            (-0.005, "-0.01°"),
-            (0.0, "0.00°"),
-            (0.001, "0.00°"),
-            (45.5, "45.50°"),
-            (-45.5, "-45.50°"),
-            (90.0, "90.00°"),
-            (180.0, "180.00°"),
-            (270.0, "270.00°"),
-            (359.99, "359.99°"),
-            (360.0, "360.00°"),
-        ]
-
-        for input_val, expected in test_cases:
-            result = dip_strike_math.format_bearing(input_val)
-            assert result == expected, f"Failed for {input_val}: expected {expected}, got {result}"
-
     def test_is_layer_suitable_for_dip_strike(self):
         """Test layer suitability check for dip/strike features."""
         from dip_strike_tools.gui.dlg_insert_dip_strike import DlgInsertDipStrike